@@ -0,0 +1,3 @@
+"""Pycraft: a fluent Python code generation toolkit."""
+
+__version__ = "0.1.0"
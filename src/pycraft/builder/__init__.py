@@ -1,5 +1,6 @@
 """Builders package exports."""
 
+from .base import BlockBuilder
 from .control_flow import (
     CaseBuilder,
     ElifBuilder,
@@ -28,6 +29,8 @@ from .control_flow import (
 from .functions import ClassDefBuilder, FunctionDefBuilder, async_func, class_, func
 
 __all__ = [
+    # Base
+    "BlockBuilder",
     # Functions
     "ClassDefBuilder",
     "FunctionDefBuilder",
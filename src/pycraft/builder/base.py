@@ -0,0 +1,102 @@
+"""Base context manager shared by the block builders.
+
+Every builder that opens a block follows the same protocol: push the node
+on enter, pop it on exit and attach it to its parent. This module holds that
+protocol once so the concrete builders only describe the node they create.
+"""
+
+import types
+from typing import TYPE_CHECKING, Self
+
+from pycraft.core.base import BodyNode
+from pycraft.core.builder import _PASS
+
+if TYPE_CHECKING:
+    from pycraft.core.builder import Builder
+    from pycraft.nodes import BaseNode
+
+
+def _clause_list(builder: Builder, name: str) -> list[BaseNode] | None:
+    """Find the clause list an elif, else, except or finally block attaches to.
+
+    A clause written after its statement continues the previous node in the
+    current body; a clause written inside the statement's own block continues
+    the enclosing node on the stack.
+
+    Args:
+        builder: The builder the clause block was opened on
+        name: The clause field (``or_else``, ``handlers`` or ``finalbody``)
+
+    Returns:
+        The clause list, or None if neither node has that field
+    """
+    body = builder._current_body
+    if body:
+        items = getattr(body[-1], name, None)
+        if items is not None:
+            return items
+    return getattr(builder._stack[-1], name, None)
+
+
+class BlockBuilder:
+    """Context manager for building a node that owns a block of statements.
+
+    Subclasses set ``self.builder`` and ``self.node`` in ``__init__``. On exit
+    the node is popped and appended to the parent's body; clauses that attach
+    elsewhere (elif, else, case, except) override ``__exit__`` and use
+    ``_close`` to pop the node.
+    """
+
+    __slots__ = ("builder", "node")
+
+    builder: Builder
+    node: BaseNode
+
+    # __enter__/__exit__ inline Builder._push_node/_pop_node: they run once
+    # per block, so skipping the extra method calls adds up on large trees.
+    def __enter__(self) -> Self:
+        builder = self.builder
+        node = self.node
+        builder._stack.append(node)
+        builder._body_stack.append(builder._current_body)
+        builder._current_body = (
+            node.body if isinstance(node, BodyNode) else builder.root_nodes
+        )
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ):
+        builder = self.builder
+        node = builder._stack.pop()
+        builder._current_body = body = builder._body_stack.pop()
+
+        # Add Pass to empty bodies (for valid Python code)
+        if isinstance(node, BodyNode) and not node.body:
+            node.body.append(_PASS)
+
+        # Add to parent's body
+        body.append(node)
+        return False
+
+    def _close(self) -> BaseNode:
+        """Pop this block's node without attaching it to the parent body.
+
+        Returns:
+            The popped node, with a Pass statement added if its body is empty
+        """
+        builder = self.builder
+        node = builder._stack.pop()
+        builder._current_body = builder._body_stack.pop()
+
+        # Ensure body has at least Pass
+        if isinstance(node, BodyNode) and not node.body:
+            node.body.append(_PASS)
+
+        return node
+
+
+__all__ = ["BlockBuilder"]
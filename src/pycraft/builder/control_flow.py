@@ -12,47 +12,37 @@ if TYPE_CHECKING:
     from pycraft.nodes import BaseNode
 
 from pycraft.core.base import BodyNode
+from pycraft.nodes.context_managers import With, WithItem
 from pycraft.nodes.control_flow import Elif, Else, If, Match, MatchCase
 from pycraft.nodes.exceptions import ExceptHandler, Try
-from pycraft.nodes.loops import While
+from pycraft.nodes.loops import AsyncFor, For, While
+
+from .base import _PASS, BlockBuilder, _clause_list
 
 # ============================================================================
 # Control Flow Builders
 # ============================================================================
 
 
-class IfBuilder:
+class IfBuilder(BlockBuilder):
     """Context manager for building if statements."""
 
-    def __init__(self, builder: Builder, test: BaseNode, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, builder: Builder, test: BaseNode):
         self.builder = builder
         self.node = If(test=test, body=[], or_else=[])
 
-    def __enter__(self):
-        self.builder._push_node(self.node)
-        return self
-
-    def __exit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: types.TracebackType | None,
-    ):
-        self.builder._pop_node()
-        return False
-
 
-class ElifBuilder:
+class ElifBuilder(BlockBuilder):
     """Context manager for building elif statements."""
 
-    def __init__(self, builder: Builder, test: BaseNode, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, builder: Builder, test: BaseNode):
         self.builder = builder
         self.node = Elif(test=test, body=[])
 
-    def __enter__(self):
-        self.builder._push_node(self.node)
-        return self
-
     def __exit__(
         self,
         exc_type: type[BaseException] | None,
@@ -60,39 +50,28 @@ class ElifBuilder:
         exc_tb: types.TracebackType | None,
     ):
         # Special handling for elif - add to previous if's or_else
-        node = self.builder._stack.pop()
-
-        # Ensure body has at least Pass
-        from pycraft.nodes import Pass
-
-        if isinstance(node, BodyNode) and not node.body:
-            node.body.append(Pass())
-
-        # Find the parent If/Elif node and add to its or_else
-        if self.builder._stack:
-            parent = self.builder._stack[-1]
-            if isinstance(parent, (If, While, Try)):
-                parent.or_else.append(node)
-            else:
-                # Fallback: add to current body
-                self.builder._get_current_body().append(node)
+        builder = self.builder
+        node = self._close()
+
+        or_else = _clause_list(builder, "or_else")
+        if or_else is not None:
+            or_else.append(node)
         else:
-            self.builder.root_nodes.append(node)
+            # Fallback: add to current body
+            builder._current_body.append(node)
 
         return False
 
 
-class ElseBuilder:
+class ElseBuilder(BlockBuilder):
     """Context manager for building else statements."""
 
-    def __init__(self, builder: Builder, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, builder: Builder):
         self.builder = builder
         self.node: Else = Else(body=[])
 
-    def __enter__(self):
-        self.builder._push_node(self.node)
-        return self
-
     def __exit__(
         self,
         exc_type: type[BaseException] | None,
@@ -100,66 +79,43 @@ class ElseBuilder:
         exc_tb: types.TracebackType | None,
     ):
         # Special handling for else - add to previous if/elif's or_else
-        node = self.builder._stack.pop()
-
-        # Ensure body has at least Pass
-        from pycraft.nodes import Pass
-
-        if isinstance(node, BodyNode) and not node.body:
-            node.body.append(Pass())
-
-        # Find the parent If/Elif node and extend its or_else with this else's body
-        if self.builder._stack:
-            parent = self.builder._stack[-1]
-            if isinstance(parent, (If, While, Try)) and isinstance(node, BodyNode):
-                # For else, we add its body directly to the or_else
-                parent.or_else.extend(node.body)
-            else:
-                self.builder._get_current_body().append(node)
+        builder = self.builder
+        node = self._close()
+
+        or_else = _clause_list(builder, "or_else")
+        if or_else is not None:
+            # For else, we add its body directly to the or_else
+            or_else.extend(node.body)
         else:
-            self.builder.root_nodes.append(node)
+            builder._current_body.append(node)
 
         return False
 
 
-class MatchBuilder:
+class MatchBuilder(BlockBuilder):
     """Context manager for building match statements (Python 3.10+)."""
 
-    def __init__(self, builder: Builder, subject: BaseNode, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, builder: Builder, subject: BaseNode):
         self.builder = builder
         self.node = Match(subject=subject, cases=[])
 
-    def __enter__(self):
-        self.builder._push_node(self.node)
-        return self
-
-    def __exit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: types.TracebackType | None,
-    ):
-        self.builder._pop_node()
-        return False
-
 
-class CaseBuilder:
+class CaseBuilder(BlockBuilder):
     """Context manager for building case statements (Python 3.10+)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         builder: Builder,
         pattern: BaseNode,
         guard: BaseNode | None = None,
-        **kwargs,
     ):
         self.builder = builder
         self.node = MatchCase(pattern=pattern, guard=guard, body=[])
 
-    def __enter__(self):
-        self.builder._push_node(self.node)
-        return self
-
     def __exit__(
         self,
         exc_type: type[BaseException] | None,
@@ -167,18 +123,11 @@ class CaseBuilder:
         exc_tb: types.TracebackType | None,
     ):
         # Add the case to the parent Match node
-        node = self.builder._stack.pop()
-
-        # Ensure body has at least Pass
-        from pycraft.nodes import Pass
+        node = self._close()
 
-        if isinstance(node, BodyNode) and not node.body:
-            node.body.append(Pass())
-
-        if self.builder._stack:
-            parent = self.builder._stack[-1]
-            if isinstance(parent, Match):
-                parent.cases.append(node)
+        cases = getattr(self.builder._stack[-1], "cases", None)
+        if cases is not None:
+            cases.append(node)
 
         return False
 
@@ -188,101 +137,62 @@ class CaseBuilder:
 # ============================================================================
 
 
-class ForBuilder:
+class ForBuilder(BlockBuilder):
     """Context manager for building for loops."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         builder: Builder,
         target: BaseNode,
         iter: BaseNode,
         is_async: bool = False,
-        **kwargs,
     ):
-        from pycraft.nodes import AsyncFor, For
-
         self.builder = builder
         NodeClass = AsyncFor if is_async else For
         self.node = NodeClass(target=target, iter=iter, body=[])
 
-    def __enter__(self):
-        self.builder._push_node(self.node)
-        return self
-
-    def __exit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: types.TracebackType | None,
-    ):
-        self.builder._pop_node()
-        return False
-
 
-class WhileBuilder:
+class WhileBuilder(BlockBuilder):
     """Context manager for building while loops."""
 
-    def __init__(self, builder: Builder, test: BaseNode, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, builder: Builder, test: BaseNode):
         self.builder = builder
         self.node = While(test=test, body=[], or_else=[])
 
-    def __enter__(self):
-        self.builder._push_node(self.node)
-        return self
-
-    def __exit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: types.TracebackType | None,
-    ):
-        self.builder._pop_node()
-        return False
-
 
 # ============================================================================
 # Exception Handling Builders
 # ============================================================================
 
 
-class TryBuilder:
+class TryBuilder(BlockBuilder):
     """Context manager for building try statements."""
 
-    def __init__(self, builder: Builder, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, builder: Builder):
         self.builder = builder
         self.node: Try = Try(body=[], handlers=[], or_else=[], finalbody=[])
 
-    def __enter__(self):
-        self.builder._push_node(self.node)
-        return self
-
-    def __exit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: types.TracebackType | None,
-    ):
-        self.builder._pop_node()
-        return False
-
 
-class ExceptBuilder:
+class ExceptBuilder(BlockBuilder):
     """Context manager for building except handlers."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         builder: Builder,
         exc_type: BaseNode | None = None,
         name: str | None = None,
-        **kwargs,
     ):
         self.builder = builder
         self.node = ExceptHandler(type=exc_type, name=name, body=[])
 
-    def __enter__(self):
-        self.builder._push_node(self.node)
-        return self
-
     def __exit__(
         self,
         exc_type: type[BaseException] | None,
@@ -290,39 +200,35 @@ class ExceptBuilder:
         exc_tb: types.TracebackType | None,
     ):
         # Add the handler to the parent Try node
-        node = self.builder._stack.pop()
-
-        # Ensure body has at least Pass
-        from pycraft.nodes import Pass
-
-        if isinstance(node, BodyNode) and not node.body:
-            node.body.append(Pass())
+        builder = self.builder
+        node = self._close()
 
-        if self.builder._stack:
-            parent = self.builder._stack[-1]
-            if isinstance(parent, Try):
-                parent.handlers.append(node)
-            else:
-                self.builder._get_current_body().append(node)
+        handlers = _clause_list(builder, "handlers")
+        if handlers is not None:
+            handlers.append(node)
+        else:
+            # No Try to attach to: add to current body
+            builder._current_body.append(node)
 
         return False
 
 
-class FinallyBuilder:
+class FinallyBuilder(BodyNode):
     """Context manager for building finally blocks."""
 
-    def __init__(self, builder: Builder, **kwargs):
-        self.builder = builder
-        self.temp_body: list[BaseNode] = []
+    __slots__ = ("builder", "body")
 
-    @property
-    def body(self) -> list[BaseNode]:
-        """Property to make FinallyBuilder compatible with builder's _get_current_body."""
-        return self.temp_body
+    def __init__(self, builder: Builder):
+        self.builder = builder
+        # Collects the finally statements while the block is open
+        self.body: list[BaseNode] = []
 
     def __enter__(self) -> Self:
         # Push ourselves to the stack so builder.add_node works
-        self.builder._stack.append(self)  # type: ignore[arg-type]
+        builder = self.builder
+        builder._stack.append(self)  # type: ignore[arg-type]
+        builder._body_stack.append(builder._current_body)
+        builder._current_body = self.body
         return self
 
     def __exit__(
@@ -332,19 +238,18 @@ class FinallyBuilder:
         exc_tb: types.TracebackType | None,
     ):
         # Pop ourselves
-        self.builder._stack.pop()
+        builder = self.builder
+        builder._stack.pop()
+        builder._current_body = builder._body_stack.pop()
 
         # Add Pass if empty
-        from pycraft.nodes import Pass
+        if not self.body:
+            self.body.append(_PASS)
 
-        if not self.temp_body:
-            self.temp_body.append(Pass())
-
-        # Find the parent Try node and add to finalbody
-        if self.builder._stack:
-            parent = self.builder._stack[-1]
-            if isinstance(parent, Try):
-                parent.finalbody.extend(self.temp_body)
+        # Find the Try node and add to finalbody
+        finalbody = _clause_list(builder, "finalbody")
+        if finalbody is not None:
+            finalbody.extend(self.body)
 
         return False
 
@@ -354,35 +259,21 @@ class FinallyBuilder:
 # ============================================================================
 
 
-class WithBuilder:
+class WithBuilder(BlockBuilder):
     """Context manager for building with statements."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         builder: Builder,
         context_expr: BaseNode,
         optional_vars: BaseNode | None = None,
-        **kwargs: Any,
     ):
-        from pycraft.nodes import With, WithItem
-
         self.builder = builder
         items: list = [WithItem(context_expr=context_expr, optional_vars=optional_vars)]
         self.node = With(items=items, body=[])
 
-    def __enter__(self) -> Self:
-        self.builder._push_node(self.node)
-        return self
-
-    def __exit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: types.TracebackType | None,
-    ):
-        self.builder._pop_node()
-        return False
-
 
 # ============================================================================
 # Convenience Functions
@@ -391,53 +282,53 @@ class WithBuilder:
 
 def if_(builder: Builder, test: BaseNode, **kwargs: Any) -> IfBuilder:
     """Create an if statement builder."""
-    return IfBuilder(builder, test, **kwargs)
+    return IfBuilder(builder, test)
 
 
 def elif_(builder: Builder, test: BaseNode, **kwargs: Any) -> ElifBuilder:
     """Create an elif statement builder."""
-    return ElifBuilder(builder, test, **kwargs)
+    return ElifBuilder(builder, test)
 
 
 def else_(builder: Builder, **kwargs: Any) -> ElseBuilder:
     """Create an else statement builder."""
-    return ElseBuilder(builder, **kwargs)
+    return ElseBuilder(builder)
 
 
 def match_(builder: Builder, subject: BaseNode, **kwargs: Any) -> MatchBuilder:
     """Create a match statement builder (Python 3.10+)."""
-    return MatchBuilder(builder, subject, **kwargs)
+    return MatchBuilder(builder, subject)
 
 
 def case_(
     builder: Builder, pattern: BaseNode, guard: BaseNode | None = None, **kwargs: Any
 ) -> CaseBuilder:
     """Create a case statement builder (Python 3.10+)."""
-    return CaseBuilder(builder, pattern, guard, **kwargs)
+    return CaseBuilder(builder, pattern, guard)
 
 
 def for_(
     builder: Builder, target: BaseNode, iter: BaseNode, **kwargs: Any
 ) -> ForBuilder:
     """Create a for loop builder."""
-    return ForBuilder(builder, target, iter, **kwargs)
+    return ForBuilder(builder, target, iter)
 
 
 def async_for(
     builder: Builder, target: BaseNode, iter: BaseNode, **kwargs: Any
 ) -> ForBuilder:
     """Create an async for loop builder."""
-    return ForBuilder(builder, target, iter, is_async=True, **kwargs)
+    return ForBuilder(builder, target, iter, is_async=True)
 
 
 def while_(builder: Builder, test: BaseNode, **kwargs: Any) -> WhileBuilder:
     """Create a while loop builder."""
-    return WhileBuilder(builder, test, **kwargs)
+    return WhileBuilder(builder, test)
 
 
 def try_(builder: Builder, **kwargs: Any) -> TryBuilder:
     """Create a try statement builder."""
-    return TryBuilder(builder, **kwargs)
+    return TryBuilder(builder)
 
 
 def except_(
@@ -447,12 +338,12 @@ def except_(
     **kwargs: Any,
 ) -> ExceptBuilder:
     """Create an except handler builder."""
-    return ExceptBuilder(builder, exc_type, name, **kwargs)
+    return ExceptBuilder(builder, exc_type, name)
 
 
 def finally_(builder: Builder, **kwargs: Any) -> FinallyBuilder:
     """Create a finally block builder."""
-    return FinallyBuilder(builder, **kwargs)
+    return FinallyBuilder(builder)
 
 
 def with_(
@@ -462,7 +353,7 @@ def with_(
     **kwargs: Any,
 ) -> WithBuilder:
     """Create a with statement builder."""
-    return WithBuilder(builder, context_expr, optional_vars, **kwargs)
+    return WithBuilder(builder, context_expr, optional_vars)
 
 
 __all__ = [
@@ -3,44 +3,33 @@
 This module provides context managers for building function and class definitions.
 """
 
-import types
-from typing import TYPE_CHECKING, Any, Self
+from typing import TYPE_CHECKING, Any
+
+from pycraft.nodes import Arguments, AsyncFunctionDef, ClassDef, FunctionDef, Name
+
+from .base import BlockBuilder
 
 if TYPE_CHECKING:
     from pycraft.core.builder import Builder
-    from pycraft.nodes import Arguments
 
 
-class ClassDefBuilder:
+class ClassDefBuilder(BlockBuilder):
     """Context manager for building class definitions."""
 
-    def __init__(
-        self, builder: Builder, name: str, bases: list | None = None, **kwargs: Any
-    ) -> None:
-        from pycraft.nodes import ClassDef
+    __slots__ = ()
 
+    def __init__(self, builder: Builder, name: str, bases: list | None = None) -> None:
         self.builder = builder
         self.node = ClassDef(
             name=name, bases=bases or [], body=[], keywords=[], decorators=[]
         )
 
-    def __enter__(self) -> Self:
-        self.builder._push_node(self.node)
-        return self
-
-    def __exit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: types.TracebackType | None,
-    ):
-        self.builder._pop_node()
-        return False
-
 
-class FunctionDefBuilder:
+class FunctionDefBuilder(BlockBuilder):
     """Context manager for building function definitions."""
 
+    __slots__ = ("is_async",)
+
     def __init__(
         self,
         builder: Builder,
@@ -51,8 +40,6 @@ class FunctionDefBuilder:
         is_async: bool = False,
         **kwargs,
     ):
-        from pycraft.nodes import Arguments, AsyncFunctionDef, FunctionDef, Name
-
         self.builder = builder
         self.is_async = is_async
 
@@ -63,14 +50,11 @@ class FunctionDefBuilder:
         # Handle returns as string or node
         returns_node = None
         if returns:
-            if isinstance(returns, str):
-                returns_node = Name(id=returns)
-            else:
-                returns_node = returns
+            returns_node = Name(id=returns) if type(returns) is str else returns
 
         if decorators_list is None:
             decorators_list = []
-        elif not isinstance(decorators_list, list):
+        elif __debug__ and not isinstance(decorators_list, list):
             raise ValueError("decorators_list must be a list")
 
         # Extract type_params from kwargs if it exists
@@ -86,26 +70,13 @@ class FunctionDefBuilder:
             type_params=type_params,
         )
 
-    def __enter__(self):
-        self.builder._push_node(self.node)
-        return self
-
-    def __exit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: types.TracebackType | None,
-    ):
-        self.builder._pop_node()
-        return False
-
 
 # Convenience functions
 def class_(
     builder: Builder, name: str, bases: list | None = None, **kwargs
 ) -> ClassDefBuilder:
     """Create a class definition builder."""
-    return ClassDefBuilder(builder, name, bases, **kwargs)
+    return ClassDefBuilder(builder, name, bases)
 
 
 def func(
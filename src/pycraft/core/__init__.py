@@ -1,9 +1,10 @@
 """Core pycraft.core package exports."""
 
-from .base import BaseNode, BodyNode, ExprNode, NodeProtocol
+from .base import NODE_TYPES, BaseNode, BodyNode, ExprNode, NodeProtocol
 
 __all__ = [
     "BaseNode",
+    "NODE_TYPES",
     "NodeProtocol",
     "BodyNode",
     "ExprNode",
@@ -1,12 +1,27 @@
-from dataclasses import dataclass
-from typing import ClassVar, Protocol, runtime_checkable
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import Field, dataclass, field, fields
+from typing import (
+    Any,
+    ClassVar,
+    Protocol,
+    Self,
+    TypeVar,
+    get_args,
+    get_origin,
+    runtime_checkable,
+)
+
+# Node classes indexed by their TAG, filled in as subclasses are defined
+NODE_TYPES: list[type[BaseNode]] = []
+_TAGS: dict[tuple[str, str], int] = {}
 
 
-@runtime_checkable
 class NodeProtocol(Protocol):
     """Protocol defining the interface for all AST nodes.
 
     This ensures type safety and provides a contract that all nodes must follow.
+    It is meant for static type checking only; use ``isinstance(x, BaseNode)``
+    for runtime checks.
     """
 
     def __repr__(self) -> str:
@@ -14,7 +29,68 @@ class NodeProtocol(Protocol):
         ...
 
 
-@dataclass
+# Field kinds packed two bits per field into BaseNode._FIELD_KINDS
+FIELD_LEAF = 0  # plain value (str, int, ...), never a node
+FIELD_CHILD = 1  # a single child node or None
+FIELD_LIST = 2  # a sequence of child nodes
+
+
+def _mentions_node(tp: Any) -> bool:
+    """Check whether a field annotation can hold a node."""
+    if isinstance(tp, TypeVar):
+        return True
+    if isinstance(tp, type):
+        return issubclass(tp, BaseNode)
+    return any(_mentions_node(arg) for arg in get_args(tp))
+
+
+def _field_kind(tp: Any) -> int:
+    """Classify a field annotation as FIELD_LEAF, FIELD_CHILD or FIELD_LIST."""
+    if get_origin(tp) in (list, tuple, Sequence):
+        return FIELD_LIST if _mentions_node(tp) else FIELD_LEAF
+    return FIELD_CHILD if _mentions_node(tp) else FIELD_LEAF
+
+
+def _node_fields(cls: type) -> list[Field]:
+    """Get the public dataclass fields of a node class."""
+    return [f for f in fields(cls) if not f.name.startswith("_")]
+
+
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Compute BaseNode._CHILD_FIELDS for a node class."""
+    return tuple(f.name for f in _node_fields(cls))
+
+
+def _field_kinds(cls: type) -> int:
+    """Compute BaseNode._FIELD_KINDS for a node class."""
+    kinds = 0
+    for i, f in enumerate(_node_fields(cls)):
+        kinds |= _field_kind(f.type) << (2 * i)
+    return kinds
+
+
+class _PerClass:
+    """Class attribute computed from each node class the first time it is read.
+
+    Values are kept per class, so they are only computed once the class's
+    dataclass decorator has run and its fields are known.
+    """
+
+    __slots__ = ("_compute", "_values")
+
+    def __init__(self, compute: Callable[[type], Any]) -> None:
+        self._compute = compute
+        self._values: dict[type, Any] = {}
+
+    def __get__(self, instance: object, owner: type) -> Any:
+        try:
+            return self._values[owner]
+        except KeyError:
+            value = self._values[owner] = self._compute(owner)
+            return value
+
+
+@dataclass(repr=False, eq=False, slots=True)
 class BaseNode:
     """Base class for all AST nodes in the builder system.
 
@@ -26,27 +102,138 @@ class BaseNode:
 
     The __kw__ class variable can be set to associate a Python keyword with
     the node type (e.g., 'class', 'def', 'if', etc.).
+
+    Operator nodes set the OP_STR class variable to the operator's source
+    text (e.g., '+', 'not in'), so the generator can read it directly.
+
+    Every subclass gets a unique integer TAG, its index in NODE_TYPES, so
+    visitors can dispatch through a list indexed by ``node.TAG`` instead of
+    a chain of isinstance checks.
+
+    _CHILD_FIELDS lists the field names of a node class in declaration order,
+    so traversals can ``getattr`` each one without calling ``fields()``.
+    _FIELD_KINDS packs the kind of each of those fields (FIELD_LEAF,
+    FIELD_CHILD or FIELD_LIST) two bits apiece, field ``i`` at bits
+    ``2*i``, so walkers can skip leaf fields without inspecting values.
     """
 
     __kw__: ClassVar[str | None] = None
+    OP_STR: ClassVar[str | None] = None
+    TAG: ClassVar[int] = -1
+    # Not annotated, so the dataclass machinery leaves them alone
+    _CHILD_FIELDS = _PerClass(_field_names)
+    _FIELD_KINDS = _PerClass(_field_kinds)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super(BaseNode, cls).__init_subclass__(**kwargs)
+        # dataclass(slots=True) rebuilds the class it decorates, so the
+        # rebuilt class takes over the tag of the one it replaces
+        tag = _TAGS.setdefault((cls.__module__, cls.__qualname__), len(NODE_TYPES))
+        if tag == len(NODE_TYPES):
+            NODE_TYPES.append(cls)
+        else:
+            NODE_TYPES[tag] = cls
+        cls.TAG = tag
+
+    def child_nodes(self) -> list[BaseNode]:
+        """Get the nodes directly below this one, in field order.
+
+        Only fields marked FIELD_CHILD or FIELD_LIST in ``_FIELD_KINDS`` are
+        read, so nodes with no child fields (Pass, Global, Comment, operators,
+        ...) return without touching any attribute.
+
+        Returns:
+            The child nodes; non-node entries such as None are left out
+        """
+        cls = type(self)
+        kinds = cls._FIELD_KINDS
+        children: list[BaseNode] = []
+        if not kinds:
+            return children
+        for name in cls._CHILD_FIELDS:
+            kind = kinds & 3
+            kinds >>= 2
+            if kind == FIELD_CHILD:
+                child = getattr(self, name)
+                if isinstance(child, BaseNode):
+                    children.append(child)
+            elif kind == FIELD_LIST:
+                children += [
+                    child
+                    for child in getattr(self, name)
+                    if isinstance(child, BaseNode)
+                ]
+        return children
+
+    def iter_descendants(self) -> Iterator[BaseNode]:
+        """Iterate over this node and every node below it, depth first.
+
+        Children are visited in field order. The walk keeps its own stack
+        instead of recursing, so deeply nested trees cannot hit the recursion
+        limit.
+
+        Yields:
+            This node, then each descendant node in source order
+        """
+        stack: list[BaseNode] = [self]
+        pop = stack.pop
+        while stack:
+            current = pop()
+            yield current
+            children = current.child_nodes()
+            # Pushed in reverse so the first child is visited next
+            children.reverse()
+            stack += children
 
     def __repr__(self) -> str:
         """Generate a readable representation of the node."""
-        fields = []
-        for key, value in self.__dict__.items():
-            if not key.startswith("_"):
-                fields.append(f"{key}={value!r}")
-        return f"{self.__class__.__name__}({', '.join(fields)})"
+        # Read declared fields rather than __dict__ so this also works for
+        # nodes stored in __slots__
+        args = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self._CHILD_FIELDS
+        )
+        return f"{self.__class__.__name__}({args})"
+
+
+# One shared instance per _SharedNode subclass, created on first use
+_SHARED: dict[type, BaseNode] = {}
+
+
+class _SharedNode(BaseNode):
+    """Base class for node types without fields.
+
+    Such nodes carry no state, so constructing one returns the single shared
+    instance of its class. Pickling and copying go through ``__new__`` too
+    and return the same instance.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls) -> Self:
+        try:
+            return _SHARED[cls]  # type: ignore[return-value]
+        except KeyError:
+            instance = _SHARED[cls] = object.__new__(cls)
+            return instance
+
+
+# Decorator for node classes: slotted, compared and hashed by identity, and
+# printed by BaseNode.__repr__ rather than a generated __repr__ per class.
+# Node modules import it together with ``field`` from here.
+node = dataclass(slots=True, eq=False, repr=False)
 
 
 # Marker for nodes that have a body (can contain other nodes)
-@runtime_checkable
-class BodyNode(Protocol):
-    """Protocol for nodes that can contain a body of other nodes.
+class BodyNode:
+    """Base class for nodes that can contain a body of other nodes.
 
-    This includes classes, functions, loops, conditionals, etc.
+    This includes classes, functions, loops, conditionals, etc. Node classes
+    with a ``body`` field inherit from it alongside BaseNode, which keeps
+    ``isinstance(node, BodyNode)`` a plain nominal check.
     """
 
+    __slots__ = ()
+
     body: list[BaseNode]
 
 
@@ -63,7 +250,13 @@ class ExprNode(Protocol):
 
 __all__ = [
     "BaseNode",
+    "NODE_TYPES",
+    "FIELD_LEAF",
+    "FIELD_CHILD",
+    "FIELD_LIST",
     "NodeProtocol",
     "BodyNode",
     "ExprNode",
+    "node",
+    "field",
 ]
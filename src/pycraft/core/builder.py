@@ -5,12 +5,18 @@ and provides the primary interface for building Python code AST.
 """
 
 import types
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Literal, Self
 
+from pycraft.nodes import Alias, Comment, Import, ImportFrom, Module, Pass
+
+from .base import BodyNode
+
 if TYPE_CHECKING:
     from pycraft.nodes import BaseNode
 
-from .base import BodyNode
+# Pass carries no state, so one instance pads every empty body
+_PASS = Pass()
 
 
 class Builder:
@@ -27,10 +33,24 @@ class Builder:
                     builder.add_node(Return(value=Constant(value=42)))
     """
 
+    __slots__ = ("root_nodes", "_stack", "_current_body", "_body_stack")
+
+    root_nodes: list[BaseNode]
+    _stack: list[BaseNode]
+    _current_body: list[BaseNode]
+    _body_stack: list[list[BaseNode]]
+
     def __init__(self) -> None:
         """Initialize the builder with empty root nodes and stack."""
-        self.root_nodes: list[BaseNode] = []
-        self._stack: list[BaseNode] = []  # Stack of parent nodes
+        # The module node stays at the bottom of the stack, so the stack is
+        # never empty and stack[-1] is always the current parent.
+        module = Module(body=[])
+        self.root_nodes = module.body
+        self._stack = [module]  # Stack of parent nodes
+        # Body list new nodes go to, kept in sync with the top of the stack;
+        # _body_stack holds the outer bodies to restore on pop.
+        self._current_body = self.root_nodes
+        self._body_stack = []
 
     def __enter__(self) -> Self:
         """Enter builder context."""
@@ -53,12 +73,7 @@ class Builder:
         Returns:
             The body list of the current context (parent node or root)
         """
-        if self._stack:
-            parent = self._stack[-1]
-            # Get the appropriate body attribute
-            if isinstance(parent, BodyNode):
-                return parent.body
-        return self.root_nodes
+        return self._current_body
 
     def _push_node(self, node: BaseNode) -> None:
         """Push a node with body to the stack.
@@ -67,6 +82,10 @@ class Builder:
             node: The node to push onto the stack
         """
         self._stack.append(node)
+        self._body_stack.append(self._current_body)
+        self._current_body = (
+            node.body if isinstance(node, BodyNode) else self.root_nodes
+        )
 
     def _pop_node(self) -> BaseNode:
         """Pop a node from the stack and add to parent.
@@ -74,30 +93,27 @@ class Builder:
         Returns:
             The popped node
         """
-        from pycraft.nodes import Pass
-
         node = self._stack.pop()
+        self._current_body = body = self._body_stack.pop()
 
         # Add Pass to empty bodies (for valid Python code)
         if isinstance(node, BodyNode) and isinstance(node.body, list):
             if not node.body:
-                node.body.append(Pass())
+                node.body.append(_PASS)
 
         # Add to parent's body
-        self._get_current_body().append(node)
+        body.append(node)
         return node
 
     def _ensure_pass_in_empty_bodies(self) -> None:
         """Ensure all empty bodies have Pass statements."""
-        from pycraft.nodes import Pass
-
         for node in self.root_nodes:
             if (
                 isinstance(node, BodyNode)
                 and isinstance(node.body, list)
                 and not node.body
             ):
-                node.body.append(Pass())
+                node.body.append(_PASS)
 
     def add_node(self, node: BaseNode) -> None:
         """Add a node directly to the current body.
@@ -105,7 +121,15 @@ class Builder:
         Args:
             node: The node to add
         """
-        self._get_current_body().append(node)
+        self._current_body.append(node)
+
+    def add_nodes(self, nodes: Iterable[BaseNode]) -> None:
+        """Add several nodes to the current body in one call.
+
+        Args:
+            nodes: The nodes to add, in order
+        """
+        self._current_body.extend(nodes)
 
     # Convenience helpers
     def import_from(self, module: str, names: list[str], level: int = 0) -> None:
@@ -116,8 +140,6 @@ class Builder:
             names: List of names to import
             level: Relative import level (0 for absolute)
         """
-        from pycraft.nodes import Alias, ImportFrom
-
         aliases: list[Alias] = [Alias(name=name) for name in names]
         self.add_node(ImportFrom(module=module, names=aliases, level=level))
 
@@ -127,8 +149,6 @@ class Builder:
         Args:
             *modules: Module names to import
         """
-        from pycraft.nodes import Alias, Import
-
         aliases: list = [Alias(name=mod) for mod in modules]
         self.add_node(Import(names=aliases))
 
@@ -138,8 +158,6 @@ class Builder:
         Args:
             text: Comment text (without # prefix)
         """
-        from pycraft.nodes import Comment
-
         self.add_node(Comment(text=text))
 
 
@@ -0,0 +1,101 @@
+"""Persistent on-disk cache for built node trees.
+
+Building a large tree through the builder API costs the same every run, even
+when the inputs have not changed. ``cached_build`` stores the finished
+``root_nodes`` as a pickle and loads it back on later runs instead of calling
+the build function again.
+"""
+
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+from pycraft import __version__
+
+from .builder import Builder
+
+
+def _cache_dir() -> Path:
+    """Get the directory cached trees are stored in.
+
+    Returns:
+        ``$XDG_CACHE_HOME/pycraft``, or ``~/.cache/pycraft`` when unset
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "pycraft"
+
+
+def _cache_path(key: str, builder_fn: Callable[[Builder], object]) -> Path:
+    """Get the cache file for a key and build function.
+
+    The hash covers the caller's key, the Python and pycraft versions, and the
+    modification time of the file defining ``builder_fn``, so editing the
+    build script or upgrading either version invalidates old entries.
+
+    Args:
+        key: Caller-supplied key describing the build inputs
+        builder_fn: The function that builds the tree
+
+    Returns:
+        Path of the pickle file for this build
+    """
+    try:
+        source = inspect.getsourcefile(builder_fn)
+        mtime = os.stat(source).st_mtime_ns if source else None
+    except (TypeError, OSError):
+        mtime = None
+
+    digest = hashlib.sha256(
+        repr((key, tuple(sys.version_info), __version__, mtime)).encode()
+    ).hexdigest()
+    return _cache_dir() / f"{digest}.pkl"
+
+
+def cached_build(key: str, builder_fn: Callable[[Builder], object]) -> Builder:
+    """Build a tree with ``builder_fn``, reusing a cached result when possible.
+
+    On a cache hit the pickled nodes are loaded into ``root_nodes`` and
+    ``builder_fn`` is not called. On a miss (or an unreadable cache file)
+    ``builder_fn`` runs inside the builder context and the result is stored.
+
+    Args:
+        key: Caller-supplied key describing the build inputs
+        builder_fn: Function that adds nodes to the builder it is given
+
+    Returns:
+        A Builder holding the built nodes
+    """
+    path = _cache_path(key, builder_fn)
+    builder = Builder()
+
+    try:
+        with path.open("rb") as f:
+            builder.root_nodes.extend(pickle.load(f))
+        return builder
+    except Exception:
+        # Missing, stale or corrupt entry (unpickling can raise almost
+        # anything, e.g. ImportError or TypeError): rebuild below
+        builder.root_nodes.clear()
+
+    with builder:
+        builder_fn(builder)
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial pickle
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            pickle.dump(builder.root_nodes, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        # Caching is best effort; the built tree is still returned
+        pass
+
+    return builder
+
+
+__all__ = ["cached_build"]
@@ -1,16 +1,125 @@
 """Code generator for producing formatted Python code from AST nodes"""
 
+import functools
+import sys
+from collections.abc import Callable
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, TextIO
+
+from pycraft.nodes import (
+    Alias,
+    And,
+    AnnAssign,
+    Arg,
+    Arguments,
+    Assert,
+    Assign,
+    AsyncFor,
+    AsyncFunctionDef,
+    Attribute,
+    AugAssign,
+    Await,
+    BaseNode,
+    Break,
+    Call,
+    ClassDef,
+    Comment,
+    Compare,
+    Comprehension,
+    Constant,
+    Continue,
+    Delete,
+    DictComp,
+    Elif,
+    Else,
+    ExceptHandler,
+    Expr,
+    For,
+    FunctionDef,
+    GeneratorExp,
+    Global,
+    If,
+    Import,
+    ImportFrom,
+    ImportGroup,
+    Keyword,
+    Lambda,
+    ListComp,
+    Match,
+    MatchCase,
+    Name,
+    Nonlocal,
+    Not,
+    OpKind,
+    Or,
+    Pass,
+    Raise,
+    Return,
+    SetComp,
+    Starred,
+    Subscript,
+    Try,
+    TypeParam,
+    UnaryOp,
+    While,
+    With,
+    WithItem,
+    Yield,
+)
 
 if TYPE_CHECKING:
     from pycraft.core.builder import Builder
-    from pycraft.nodes import Arguments, BaseNode, Comprehension, WithItem
+
+
+@functools.lru_cache(maxsize=4096)
+def _render_str_constant(value: str, kind: str | None) -> str:
+    """Render a string literal, caching the repr of repeated strings"""
+    return f"{kind or ''}{value!r}"
+
+
+class _IndentCache(dict[int, str]):
+    """Indentation strings keyed by level, built the first time a level is used"""
+
+    __slots__ = ("indent_char",)
+
+    def __init__(self, indent_char: str):
+        super().__init__()
+        self.indent_char = indent_char
+
+    def __missing__(self, level: int) -> str:
+        # Interned so every generator using the same indent shares one string
+        indent = self[level] = sys.intern(self.indent_char * level)
+        return indent
+
+
+class _LineWriter:
+    """Line buffer stand-in that writes each line straight to a text stream.
+
+    Emitters only call ``append``, so this can replace the list they normally
+    fill. Lines are separated by newlines exactly as ``"\\n".join`` would.
+    """
+
+    __slots__ = ("_write", "_sep")
+
+    def __init__(self, fp: TextIO):
+        self._write = fp.write
+        self._sep = ""
+
+    def append(self, line: str) -> None:
+        self._write(f"{self._sep}{line}")
+        self._sep = "\n"
 
 
 class CodeGenerator:
     """Generates formatted Python code from AST nodes"""
 
+    __slots__ = ("indent_char", "indent_level", "_indents", "_expr_cache")
+
+    indent_char: str
+    indent_level: int
+    _indents: _IndentCache
+    _expr_cache: dict[int, str]
+
     def __init__(self, indent_char: str = "\t"):
         """
         Initialize code generator
@@ -20,6 +129,9 @@ class CodeGenerator:
         """
         self.indent_char = indent_char
         self.indent_level = 0
+        self._indents = _IndentCache(indent_char)
+        # Rendered Attribute/Subscript strings by node id, for one generate() run
+        self._expr_cache = {}
 
     def generate(
         self,
@@ -40,7 +152,18 @@ class CodeGenerator:
         Returns:
             Generated Python code as string
         """
-        code = self._generate_nodes(builder.root_nodes)
+        if self._indents.indent_char != self.indent_char:
+            self._indents = _IndentCache(self.indent_char)
+
+        # Node ids are only stable while the tree is alive, so the expression
+        # cache never outlives a single run
+        self._expr_cache.clear()
+        out: list[str] = []
+        try:
+            self._emit_nodes(builder.root_nodes, self.indent_level, out)
+        finally:
+            self._expr_cache.clear()
+        code = "\n".join(out)
 
         if mode == "console":
             print(code)
@@ -52,383 +175,459 @@ class CodeGenerator:
 
         return code
 
-    def _generate_nodes(self, nodes: list[BaseNode]) -> str:
-        """Generate code from a list of nodes"""
-        from pycraft.nodes import BaseNode
-
-        lines = []
-        for node in nodes:
-            if isinstance(node, BaseNode):
-                code = self._generate_node(node)
-                if code:
-                    lines.append(code)
-        return "\n".join(lines)
-
-    def _generate_node(self, node: BaseNode) -> str:
-        """Generate code for a single node"""
-        from pycraft.nodes import (
-            AnnAssign,
-            Assert,
-            Assign,
-            AsyncFor,
-            AsyncFunctionDef,
-            AugAssign,
-            Await,
-            Break,
-            ClassDef,
-            Comment,
-            Continue,
-            Delete,
-            Elif,
-            Else,
-            Expr,
-            For,
-            FunctionDef,
-            Global,
-            If,
-            Import,
-            ImportFrom,
-            ImportGroup,
-            Match,
-            MatchCase,
-            Nonlocal,
-            Pass,
-            Raise,
-            Return,
-            Try,
-            While,
-            With,
-            Yield,
-        )
+    def write(self, builder: Builder, fp: TextIO) -> None:
+        """
+        Write Python code from builder's AST to a text stream
 
-        indent = self.indent_char * self.indent_level
-
-        # Import statements
-        if isinstance(node, Import):
-            names = ", ".join(self._generate_expr(alias) for alias in node.names)
-            return f"{indent}import {names}"
-
-        elif isinstance(node, ImportFrom):
-            module = node.module or ""
-            level = "." * (node.level or 0)
-            names = ", ".join(self._generate_expr(alias) for alias in node.names)
-            return f"{indent}from {level}{module} import {names}"
-
-        elif isinstance(node, ImportGroup):
-            return self._generate_nodes(node.imports)
-
-        # Class definition
-        elif isinstance(node, ClassDef):
-            lines = []
-
-            # Render decorators
-            for decorator in node.decorators:
-                decorator_str = self._generate_expr(decorator)
-                lines.append(f"{indent}@{decorator_str}")
-
-            bases_str = ""
-            if node.bases:
-                bases_str = f"({', '.join(self._generate_expr(b) for b in node.bases)})"
-
-            lines.append(f"{indent}class {node.name}{bases_str}:")
-            self.indent_level += 1
-            body_code = self._generate_nodes(node.body)
-            lines.append(body_code)
-            self.indent_level -= 1
-            return "\n".join(lines)
-
-        # Function definition
-        elif isinstance(node, (FunctionDef, AsyncFunctionDef)):
-            lines = []
-
-            # Render decorators
-            for decorator in node.decorator_list:
-                decorator_str = self._generate_expr(decorator)
-                lines.append(f"{indent}@{decorator_str}")
-
-            prefix = "async def" if isinstance(node, AsyncFunctionDef) else "def"
-            args_str = self._generate_arguments(node.args) if node.args else ""
-            returns_str = ""
-            if node.returns:
-                returns_str = f" -> {self._safe_generate_expr(node.returns)}"
-
-            # Handle type parameters for generic functions (Python 3.12+)
-            type_params_str = ""
-            if node.type_params:
-                type_params_parts = []
-                for param in node.type_params:
-                    param_str = self._generate_expr(param)
-                    type_params_parts.append(param_str)
-                if type_params_parts:
-                    type_params_str = f"[{', '.join(type_params_parts)}]"
-
-            lines.append(
-                f"{indent}{prefix} {node.name}{type_params_str}({args_str}){returns_str}:"
-            )
-            self.indent_level += 1
-            body_code = self._generate_nodes(node.body)
-            lines.append(body_code)
-            self.indent_level -= 1
-            return "\n".join(lines)
-
-        # Control flow
-        elif isinstance(node, If):
-            test_str = self._safe_generate_expr(node.test)
-            lines = [f"{indent}if {test_str}:"]
-            self.indent_level += 1
-            body_code = self._generate_nodes(node.body)
-            lines.append(body_code)
-            self.indent_level -= 1
-
-            # Handle elif and else
-            for or_else_node in node.or_else:
-                elif_code = self._generate_node(or_else_node)
-                lines.append(elif_code)
-
-            return "\n".join(lines)
-
-        elif isinstance(node, Elif):
-            test_str = self._safe_generate_expr(node.test)
-            lines = [f"{indent}elif {test_str}:"]
-            self.indent_level += 1
-            body_code = self._generate_nodes(node.body)
-            lines.append(body_code)
-            self.indent_level -= 1
-            return "\n".join(lines)
-
-        elif isinstance(node, Else):
-            lines = [f"{indent}else:"]
-            self.indent_level += 1
-            body_code = self._generate_nodes(node.body)
-            lines.append(body_code)
-            self.indent_level -= 1
-            return "\n".join(lines)
-
-        elif isinstance(node, For):
-            target_str = self._safe_generate_expr(node.target)
-            iter_str = self._safe_generate_expr(node.iter)
-            lines = [f"{indent}for {target_str} in {iter_str}:"]
-            self.indent_level += 1
-            body_code = self._generate_nodes(node.body)
-            lines.append(body_code)
-            self.indent_level -= 1
-
-            if node.or_else:
-                lines.append(f"{indent}else:")
-                self.indent_level += 1
-                else_code = self._generate_nodes(node.or_else)
-                lines.append(else_code)
-                self.indent_level -= 1
-
-            return "\n".join(lines)
-
-        elif isinstance(node, AsyncFor):
-            target_str = self._safe_generate_expr(node.target)
-            iter_str = self._safe_generate_expr(node.iter)
-            lines = [f"{indent}async for {target_str} in {iter_str}:"]
-            self.indent_level += 1
-            body_code = self._generate_nodes(node.body)
-            lines.append(body_code)
-            self.indent_level -= 1
-
-            if node.or_else:
-                lines.append(f"{indent}else:")
-                self.indent_level += 1
-                else_code = self._generate_nodes(node.or_else)
-                lines.append(else_code)
-                self.indent_level -= 1
-
-            return "\n".join(lines)
-
-        elif isinstance(node, While):
-            test_str = self._safe_generate_expr(node.test)
-            lines = [f"{indent}while {test_str}:"]
-            self.indent_level += 1
-            body_code = self._generate_nodes(node.body)
-            lines.append(body_code)
-            self.indent_level -= 1
-
-            if node.or_else:
-                lines.append(f"{indent}else:")
-                self.indent_level += 1
-                else_code = self._generate_nodes(node.or_else)
-                lines.append(else_code)
-                self.indent_level -= 1
-
-            return "\n".join(lines)
-
-        elif isinstance(node, With):
-            # Generate with items
-            items_str = ", ".join(
-                self._safe_generate_with_item(item) for item in node.items
+        Unlike generate(), lines are written as they are produced and the
+        whole module is never held in memory as one string.
+
+        Args:
+            builder: Builder instance with root nodes
+            fp: Text stream to write to, e.g. an open file or sys.stdout
+        """
+        if self._indents.indent_char != self.indent_char:
+            self._indents = _IndentCache(self.indent_char)
+
+        self._expr_cache.clear()
+        try:
+            self._emit_nodes(
+                builder.root_nodes,
+                self.indent_level,
+                _LineWriter(fp),  # type: ignore[arg-type]
             )
-            lines = [f"{indent}with {items_str}:"]
-            self.indent_level += 1
-            body_code = self._generate_nodes(node.body)
-            lines.append(body_code)
-            self.indent_level -= 1
-            return "\n".join(lines)
-
-        elif isinstance(node, Try):
-            lines = [f"{indent}try:"]
-            self.indent_level += 1
-            body_code = self._generate_nodes(node.body)
-            lines.append(body_code)
-            self.indent_level -= 1
-
-            # Handle except clauses
-            for handler in node.handlers:
-                handler_code = self._generate_node(handler)
-                lines.append(handler_code)
-
-            # Handle else clause
-            if node.or_else:
-                lines.append(f"{indent}else:")
-                self.indent_level += 1
-                else_code = self._generate_nodes(node.or_else)
-                lines.append(else_code)
-                self.indent_level -= 1
-
-            # Handle finally clause
-            if node.finalbody:
-                lines.append(f"{indent}finally:")
-                self.indent_level += 1
-                finally_code = self._generate_nodes(node.finalbody)
-                lines.append(finally_code)
-                self.indent_level -= 1
-
-            return "\n".join(lines)
-
-        elif isinstance(node, Match):
-            subject_str = self._safe_generate_expr(node.subject)
-            lines = [f"{indent}match {subject_str}:"]
-            self.indent_level += 1
-            for case in node.cases:
-                case_code = self._generate_node(case)
-                lines.append(case_code)
-            self.indent_level -= 1
-            return "\n".join(lines)
-
-        elif isinstance(node, MatchCase):
-            pattern_str = self._safe_generate_expr(node.pattern)
-            guard_str = ""
-            if node.guard:
-                guard_str = f" if {self._safe_generate_expr(node.guard)}"
-            lines = [f"{indent}case {pattern_str}{guard_str}:"]
-            self.indent_level += 1
-            body_code = self._generate_nodes(node.body)
-            lines.append(body_code)
-            self.indent_level -= 1
-            return "\n".join(lines)
-
-        # Statements
-        elif isinstance(node, Expr):
-            value_str = self._safe_generate_expr(node.value)
-            return f"{indent}{value_str}"
+        finally:
+            self._expr_cache.clear()
 
-        elif isinstance(node, Assign):
-            targets_str = " = ".join(self._generate_expr(t) for t in node.targets)
-            value_str = self._safe_generate_expr(node.value)
-            return f"{indent}{targets_str} = {value_str}"
+    @staticmethod
+    def _resolve_handler(
+        table: dict[type, Callable[..., Any]], node_type: type
+    ) -> Callable[..., Any] | None:
+        """Find the handler for a type missing from a dispatch table.
 
-        elif isinstance(node, AugAssign):
-            target_str = self._safe_generate_expr(node.target)
-            op_str = self._generate_comparison_op(node.op) if node.op else ""
-            value_str = self._safe_generate_expr(node.value)
-            return f"{indent}{target_str} {op_str}= {value_str}"
-
-        elif isinstance(node, AnnAssign):
-            target_str = str(node.target)  # Handle string target
-            annotation_str = self._safe_generate_expr(node.annotation)
-            value_str = ""
-            if node.value:
-                value_str = f" = {self._safe_generate_expr(node.value)}"
-            return f"{indent}{target_str}: {annotation_str}{value_str}"
-
-        elif isinstance(node, Return):
-            if node.value:
-                value_str = self._safe_generate_expr(node.value)
-                return f"{indent}return {value_str}"
-            return f"{indent}return"
-
-        elif isinstance(node, Yield):
-            if node.value:
-                value_str = self._safe_generate_expr(node.value)
-                return f"{indent}yield {value_str}"
-            return f"{indent}yield"
-
-        elif isinstance(node, Await):
+        Falls back to the handler of the nearest base class, caching the
+        result under node_type.
+
+        Args:
+            table: The dispatch table to look in
+            node_type: The type of the node being generated
+
+        Returns:
+            The handler, or None if no class in the MRO has one
+        """
+        for base in node_type.__mro__:
+            handler = table.get(base)
+            if handler is not None:
+                table[node_type] = handler
+                return handler
+        return None
+
+    def _emit_nodes(self, nodes: list[BaseNode], level: int, out: list[str]) -> None:
+        """Append the lines for a list of nodes to out.
+
+        Walks the tree with an explicit work stack of (level, item) pairs
+        instead of recursing into each block. An item is either a node,
+        handed to its emitter, or an already rendered line such as a
+        clause header. Emitters write their own header lines and push their
+        child blocks, so nesting depth costs no Python frames.
+
+        Args:
+            nodes: The nodes to emit
+            level: Indentation level of the nodes
+            out: Line buffer to append to
+        """
+        stack: list[tuple[int, Any]] = []
+        self._push_block(stack, nodes, level)
+        pop = stack.pop
+        append = out.append
+        dispatch = self._DISPATCH
+
+        while stack:
+            level, item = pop()
+            if type(item) is str:
+                append(item)
+                continue
+
+            handler = dispatch.get(type(item))
+            if handler is None:
+                handler = self._resolve_handler(dispatch, type(item))
+                if handler is None:
+                    handler = CodeGenerator._emit_unknown
+                    dispatch[type(item)] = handler
+            handler(self, item, level, out, stack)
+
+    @staticmethod
+    def _push_block(stack: list, nodes: list[BaseNode], level: int) -> None:
+        """Schedule nodes to be emitted next, in order, at the given level"""
+        stack.extend(
+            [(level, node) for node in reversed(nodes) if isinstance(node, BaseNode)]
+        )
+
+    def _push_else_block(self, stack: list, body: list[BaseNode], level: int) -> None:
+        """Schedule an else: clause and its body at level, if the body is not empty"""
+        if body:
+            self._push_block(stack, body, level + 1)
+            stack.append((level, f"{self._indents[level]}else:"))
+
+    def _emit_unknown(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        out.append(f"{indent}# Unknown node: {type(node).__name__}")
+
+    # Import statements
+    def _emit_import(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        names = ", ".join([self._generate_expr(alias) for alias in node.names])
+        out.append(f"{indent}import {names}")
+
+    def _emit_import_from(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        module = node.module or ""
+        dots = "." * (node.level or 0)
+        names = ", ".join([self._generate_expr(alias) for alias in node.names])
+        out.append(f"{indent}from {dots}{module} import {names}")
+
+    def _emit_import_group(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        self._push_block(stack, node.imports, level)
+
+    # Class and function definitions
+    def _emit_class_def(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+
+        # Render decorators
+        for decorator in node.decorators:
+            decorator_str = self._generate_expr(decorator)
+            out.append(f"{indent}@{decorator_str}")
+
+        bases_str = ""
+        if node.bases:
+            bases_str = f"({', '.join([self._generate_expr(b) for b in node.bases])})"
+
+        out.append(f"{indent}class {node.name}{bases_str}:")
+        self._push_block(stack, node.body, level + 1)
+
+    def _emit_function_def(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        self._emit_function(node, level, out, stack, "def")
+
+    def _emit_async_function_def(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        self._emit_function(node, level, out, stack, "async def")
+
+    def _emit_function(
+        self, node: BaseNode, level: int, out: list[str], stack: list, prefix: str
+    ) -> None:
+        indent = self._indents[level]
+
+        # Render decorators
+        for decorator in node.decorator_list:
+            decorator_str = self._generate_expr(decorator)
+            out.append(f"{indent}@{decorator_str}")
+
+        args_str = self._generate_arguments(node.args) if node.args else ""
+        returns_str = ""
+        if node.returns:
+            returns_str = f" -> {self._safe_generate_expr(node.returns)}"
+
+        # Handle type parameters for generic functions (Python 3.12+)
+        type_params_str = ""
+        if node.type_params:
+            type_params_parts = [self._generate_expr(p) for p in node.type_params]
+            if type_params_parts:
+                type_params_str = f"[{', '.join(type_params_parts)}]"
+
+        out.append(
+            f"{indent}{prefix} {node.name}{type_params_str}({args_str}){returns_str}:"
+        )
+        self._push_block(stack, node.body, level + 1)
+
+    # Control flow
+    def _emit_if(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        test_str = self._safe_generate_expr(node.test)
+        out.append(f"{indent}if {test_str}:")
+
+        # Handle elif and else after the body. The clauses are rendered here
+        # rather than dispatched; else_() stores its statements directly in
+        # or_else, so a run of plain statements forms an else block. Items
+        # are visited last to first to push them in reverse.
+        else_body: list[BaseNode] = []
+        for item in reversed(node.or_else):
+            item_type = type(item)
+            if item_type is Elif or item_type is Else:
+                if else_body:
+                    stack.extend([(level + 1, stmt) for stmt in else_body])
+                    stack.append((level, f"{indent}else:"))
+                    else_body = []
+                self._push_block(stack, item.body, level + 1)
+                if item_type is Elif:
+                    test_str = self._safe_generate_expr(item.test)
+                    stack.append((level, f"{indent}elif {test_str}:"))
+                else:
+                    stack.append((level, f"{indent}else:"))
+            elif isinstance(item, BaseNode):
+                else_body.append(item)
+        if else_body:
+            stack.extend([(level + 1, stmt) for stmt in else_body])
+            stack.append((level, f"{indent}else:"))
+
+        self._push_block(stack, node.body, level + 1)
+
+    def _emit_elif(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        test_str = self._safe_generate_expr(node.test)
+        out.append(f"{indent}elif {test_str}:")
+        self._push_block(stack, node.body, level + 1)
+
+    def _emit_else(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        out.append(f"{indent}else:")
+        self._push_block(stack, node.body, level + 1)
+
+    def _emit_for(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        target_str = self._safe_generate_expr(node.target)
+        iter_str = self._safe_generate_expr(node.iter)
+        out.append(f"{indent}for {target_str} in {iter_str}:")
+
+        self._push_else_block(stack, node.or_else, level)
+        self._push_block(stack, node.body, level + 1)
+
+    def _emit_async_for(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        target_str = self._safe_generate_expr(node.target)
+        iter_str = self._safe_generate_expr(node.iter)
+        out.append(f"{indent}async for {target_str} in {iter_str}:")
+
+        self._push_else_block(stack, node.or_else, level)
+        self._push_block(stack, node.body, level + 1)
+
+    def _emit_while(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        test_str = self._safe_generate_expr(node.test)
+        out.append(f"{indent}while {test_str}:")
+
+        self._push_else_block(stack, node.or_else, level)
+        self._push_block(stack, node.body, level + 1)
+
+    def _emit_with(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        # Generate with items
+        items_str = ", ".join(
+            [self._safe_generate_with_item(item) for item in node.items]
+        )
+        out.append(f"{indent}with {items_str}:")
+        self._push_block(stack, node.body, level + 1)
+
+    def _emit_try(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        out.append(f"{indent}try:")
+
+        # Clauses are pushed last to first so they come out in order
+        # Handle finally clause
+        if node.finalbody:
+            self._push_block(stack, node.finalbody, level + 1)
+            stack.append((level, f"{indent}finally:"))
+
+        # Handle else clause
+        self._push_else_block(stack, node.or_else, level)
+
+        # Handle except clauses
+        self._push_block(stack, node.handlers, level)
+        self._push_block(stack, node.body, level + 1)
+
+    def _emit_except_handler(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        type_str = ""
+        if node.type:
+            type_str = f"{self._safe_generate_expr(node.type)}"
+            if node.name:
+                type_str += f" as {node.name}"
+        elif node.name:
+            type_str = f" {node.name}"
+
+        except_line = f"{indent}except"
+        if type_str:
+            except_line += f" {type_str}"
+        except_line += ":"
+
+        out.append(except_line)
+        self._push_block(stack, node.body, level + 1)
+
+    def _emit_match(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        subject_str = self._safe_generate_expr(node.subject)
+        out.append(f"{indent}match {subject_str}:")
+        self._push_block(stack, node.cases, level + 1)
+
+    def _emit_match_case(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        pattern_str = self._safe_generate_expr(node.pattern)
+        guard_str = ""
+        if node.guard:
+            guard_str = f" if {self._safe_generate_expr(node.guard)}"
+        out.append(f"{indent}case {pattern_str}{guard_str}:")
+        self._push_block(stack, node.body, level + 1)
+
+    # Statements
+    def _emit_expr(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        value_str = self._safe_generate_expr(node.value)
+        out.append(f"{indent}{value_str}")
+
+    def _emit_assign(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        targets_str = " = ".join([self._generate_expr(t) for t in node.targets])
+        value_str = self._safe_generate_expr(node.value)
+        out.append(f"{indent}{targets_str} = {value_str}")
+
+    def _emit_aug_assign(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        target_str = self._safe_generate_expr(node.target)
+        op_str = (
+            self._generate_comparison_op(node.op) if node.op is not None else ""
+        )
+        value_str = self._safe_generate_expr(node.value)
+        out.append(f"{indent}{target_str} {op_str}= {value_str}")
+
+    def _emit_ann_assign(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        target_str = str(node.target)  # Handle string target
+        annotation_str = self._safe_generate_expr(node.annotation)
+        value_str = ""
+        if node.value:
+            value_str = f" = {self._safe_generate_expr(node.value)}"
+        out.append(f"{indent}{target_str}: {annotation_str}{value_str}")
+
+    def _emit_return(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        if node.value:
             value_str = self._safe_generate_expr(node.value)
-            return f"{indent}await {value_str}"
-
-        elif isinstance(node, Delete):
-            targets_str = ", ".join(self._generate_expr(t) for t in node.targets)
-            return f"{indent}del {targets_str}"
-
-        elif isinstance(node, Global):
-            names_str = ", ".join(node.names)
-            return f"{indent}global {names_str}"
-
-        elif isinstance(node, Nonlocal):
-            names_str = ", ".join(node.names)
-            return f"{indent}nonlocal {names_str}"
-
-        elif isinstance(node, Assert):
-            test_str = self._safe_generate_expr(node.test)
-            if node.msg:
-                msg_str = self._safe_generate_expr(node.msg)
-                return f"{indent}assert {test_str}, {msg_str}"
-            return f"{indent}assert {test_str}"
-
-        elif isinstance(node, Raise):
-            if node.exc:
-                exc_str = self._safe_generate_expr(node.exc)
-                if node.cause:
-                    cause_str = self._safe_generate_expr(node.cause)
-                    return f"{indent}raise {exc_str} from {cause_str}"
-                return f"{indent}raise {exc_str}"
-            return f"{indent}raise"
-
-        elif isinstance(node, Pass):
-            return f"{indent}pass"
-
-        elif isinstance(node, Break):
-            return f"{indent}break"
-
-        elif isinstance(node, Continue):
-            return f"{indent}continue"
-
-        elif isinstance(node, Comment):
-            if node.text:
-                return f"{indent}# {node.text}"
-            return ""
+            out.append(f"{indent}return {value_str}")
+        else:
+            out.append(f"{indent}return")
 
+    def _emit_yield(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        if node.value:
+            value_str = self._safe_generate_expr(node.value)
+            out.append(f"{indent}yield {value_str}")
+        else:
+            out.append(f"{indent}yield")
+
+    def _emit_await(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        value_str = self._safe_generate_expr(node.value)
+        out.append(f"{indent}await {value_str}")
+
+    def _emit_delete(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        targets_str = ", ".join([self._generate_expr(t) for t in node.targets])
+        out.append(f"{indent}del {targets_str}")
+
+    def _emit_name_decl(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        # Global and Nonlocal differ only in their keyword
+        indent = self._indents[level]
+        names_str = ", ".join(node.names)
+        out.append(f"{indent}{node.__kw__} {names_str}")
+
+    def _emit_assert(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        test_str = self._safe_generate_expr(node.test)
+        if node.msg:
+            msg_str = self._safe_generate_expr(node.msg)
+            out.append(f"{indent}assert {test_str}, {msg_str}")
+        else:
+            out.append(f"{indent}assert {test_str}")
+
+    def _emit_raise(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        indent = self._indents[level]
+        if node.exc:
+            exc_str = self._safe_generate_expr(node.exc)
+            if node.cause:
+                cause_str = self._safe_generate_expr(node.cause)
+                out.append(f"{indent}raise {exc_str} from {cause_str}")
+            else:
+                out.append(f"{indent}raise {exc_str}")
         else:
-            # ExceptHandler is handled within Try
-            from pycraft.nodes import ExceptHandler
-
-            if isinstance(node, ExceptHandler):
-                type_str = ""
-                if node.type:
-                    type_str = f"{self._safe_generate_expr(node.type)}"
-                    if node.name:
-                        type_str += f" as {node.name}"
-                elif node.name:
-                    type_str = f" {node.name}"
-
-                except_line = f"{indent}except"
-                if type_str:
-                    except_line += f" {type_str}"
-                except_line += ":"
-
-                lines = [except_line]
-                self.indent_level += 1
-                body_code = self._generate_nodes(node.body)
-                lines.append(body_code)
-                self.indent_level -= 1
-                return "\n".join(lines)
-
-            return f"{indent}# Unknown node: {type(node).__name__}"
+            out.append(f"{indent}raise")
+
+    def _emit_pass(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        out.append(f"{self._indents[level]}pass")
+
+    def _emit_break(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        out.append(f"{self._indents[level]}break")
+
+    def _emit_continue(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        out.append(f"{self._indents[level]}continue")
+
+    def _emit_comment(
+        self, node: BaseNode, level: int, out: list[str], stack: list
+    ) -> None:
+        # Empty comments produce no line
+        if node.text:
+            out.append(f"{self._indents[level]}# {node.text}")
 
     def _safe_generate_expr(self, expr: BaseNode | None) -> str:
         """Generate expression string from node, handling None."""
@@ -438,181 +637,139 @@ class CodeGenerator:
 
     def _generate_expr(self, expr: BaseNode) -> str:
         """Generate expression string from node"""
-        from pycraft.nodes import (
-            Alias,
-            And,
-            Arg,
-            Attribute,
-            Await,
-            Call,
-            Compare,
-            Constant,
-            DictComp,
-            GeneratorExp,
-            In,
-            Is,
-            IsNot,
-            Keyword,
-            Lambda,
-            ListComp,
-            Name,
-            Not,
-            NotIn,
-            Or,
-            SetComp,
-            Starred,
-            Subscript,
-            UnaryOp,
-        )
+        expr_type = type(expr)
 
-        if isinstance(expr, Name):
+        # Names and constants make up most expressions; skip the table for them
+        if expr_type is Name:
             return expr.id
-
-        elif isinstance(expr, Constant):
-            if isinstance(expr.value, str):
-                prefix = expr.kind if expr.kind else ""
-                return f"{prefix}{repr(expr.value)}"
-            elif isinstance(expr.value, bool):
-                return str(expr.value)
-            elif expr.value is None:
-                return "None"
-            return str(expr.value)
-
-        elif isinstance(expr, Alias):
-            if expr.asname:
-                return f"{expr.name} as {expr.asname}"
-            return expr.name
-
-        elif isinstance(expr, Call):
-            func_str = self._safe_generate_expr(expr.func)
-            args_list = [self._generate_expr(arg) for arg in expr.args]
-
-            for kw in expr.keywords:
-                if isinstance(kw, Keyword):
-                    kw_str = f"{kw.arg}={self._safe_generate_expr(kw.value)}"
-                    args_list.append(kw_str)
-                elif isinstance(kw, dict):
-                    kw_str = f"{kw['arg']}={self._generate_expr(kw['value'])}"
-                    args_list.append(kw_str)
-
-            return f"{func_str}({', '.join(args_list)})"
-
-        elif isinstance(expr, Attribute):
+        if expr_type is Constant:
+            return self._generate_constant(expr)
+
+        handler = self._EXPR_DISPATCH.get(expr_type)
+        if handler is None:
+            handler = self._resolve_handler(self._EXPR_DISPATCH, expr_type)
+            if handler is None:
+                handler = CodeGenerator._generate_other_expr
+                self._EXPR_DISPATCH[expr_type] = handler
+        return handler(self, expr)
+
+    def _generate_name(self, expr: BaseNode) -> str:
+        return expr.id
+
+    def _generate_constant(self, expr: BaseNode) -> str:
+        value = expr.value
+        fmt = self._CONST_FMT.get(type(value))
+        if fmt is not None:
+            return fmt(value, expr.kind)
+        # Subclasses of str (e.g. StrEnum members) hash and compare equal to
+        # plain strings but may repr differently, so they bypass the cache
+        if isinstance(value, str):
+            return f"{expr.kind or ''}{value!r}"
+        return str(value)
+
+    def _generate_alias(self, expr: BaseNode) -> str:
+        if expr.asname:
+            return f"{expr.name} as {expr.asname}"
+        return expr.name
+
+    def _generate_call(self, expr: BaseNode) -> str:
+        func_str = self._safe_generate_expr(expr.func)
+        args_list = [self._generate_expr(arg) for arg in expr.args]
+
+        for kw in expr.keywords:
+            if isinstance(kw, Keyword):
+                kw_str = f"{kw.arg}={self._safe_generate_expr(kw.value)}"
+                args_list.append(kw_str)
+            elif isinstance(kw, dict):
+                kw_str = f"{kw['arg']}={self._generate_expr(kw['value'])}"
+                args_list.append(kw_str)
+
+        return f"{func_str}({', '.join(args_list)})"
+
+    def _generate_attribute(self, expr: BaseNode) -> str:
+        # Shared attribute chains (self.x, os.path) are rendered once per run
+        text = self._expr_cache.get(id(expr))
+        if text is None:
             value_str = self._safe_generate_expr(expr.value)
-            return f"{value_str}.{expr.attr}"
+            text = self._expr_cache[id(expr)] = f"{value_str}.{expr.attr}"
+        return text
 
-        elif isinstance(expr, Subscript):
+    def _generate_subscript(self, expr: BaseNode) -> str:
+        text = self._expr_cache.get(id(expr))
+        if text is None:
             value_str = self._safe_generate_expr(expr.value)
             slice_str = self._safe_generate_expr(expr.slice)
-            return f"{value_str}[{slice_str}]"
-
-        elif isinstance(expr, Compare):
-            left_str = self._safe_generate_expr(expr.left)
-            parts = [left_str]
-            for op, comparator in zip(expr.ops, expr.comparators, strict=False):
-                op_str = self._generate_comparison_op(op)
-                comp_str = self._generate_expr(comparator)
-                parts.append(f"{op_str} {comp_str}")
-            return " ".join(parts)
-
-        elif isinstance(expr, Lambda):
-            args_str = ""
-            if isinstance(expr.args, Arguments):
-                args_str = self._generate_arguments(expr.args)
-            body_str = self._safe_generate_expr(expr.body)
-            return f"lambda {args_str}: {body_str}"
-
-        elif isinstance(expr, Await):
-            value_str = self._safe_generate_expr(expr.value)
-            return f"await {value_str}"
-
-        elif isinstance(expr, UnaryOp):
-            op_str = getattr(expr.op, "__kw__", str(expr.op))
-            operand_str = self._safe_generate_expr(expr.operand)
-            return f"{op_str} {operand_str}"
-
-        elif isinstance(expr, (And, Or, Not)):
-            return getattr(expr, "__kw__", str(expr))
-
-        elif isinstance(expr, Arg):
-            result = expr.arg
-            if expr.annotation:
-                annotation_str = self._safe_generate_expr(expr.annotation)
-                result += f": {annotation_str}"
-            return result
-
-        elif isinstance(expr, Starred):
-            value_str = self._safe_generate_expr(expr.value)
-            return f"*{value_str}"
-
-        elif isinstance(expr, ListComp):
-            elt_str = self._safe_generate_expr(expr.elt)
-            gens_str = " ".join(
-                self._generate_comprehension(c) for c in expr.generators
-            )
-            return f"[{elt_str} {gens_str}]"
-
-        elif isinstance(expr, SetComp):
-            elt_str = self._safe_generate_expr(expr.elt)
-            gens_str = " ".join(
-                self._generate_comprehension(c) for c in expr.generators
-            )
-            return f"{{{elt_str} {gens_str}}}"
-
-        elif isinstance(expr, DictComp):
-            key_str = self._safe_generate_expr(expr.key)
-            value_str = self._safe_generate_expr(expr.value)
-            gens_str = " ".join(
-                self._generate_comprehension(c) for c in expr.generators
-            )
-            return f"{{{key_str}: {value_str} {gens_str}}}"
-
-        elif isinstance(expr, GeneratorExp):
-            elt_str = self._safe_generate_expr(expr.elt)
-            gens_str = " ".join(
-                self._generate_comprehension(c) for c in expr.generators
-            )
-            return f"({elt_str} {gens_str})"
-
-        # Handle TypeParam node specifically
-        elif hasattr(expr, "__class__") and expr.__class__.__name__ == "TypeParam":
-            # We import TypeParam locally to avoid circular imports if needed,
-            # or just rely on the name check but safer.
-            # Better: import TypeParam at top or use isinstance if imported.
-            from pycraft.nodes.functions import TypeParam
-
-            if isinstance(expr, TypeParam):
-                if expr.bound:
-                    bound_str = self._safe_generate_expr(expr.bound)
-                    return f"{expr.name}: {bound_str}"
-                return str(expr.name)
-
-        elif isinstance(
-            expr,
-            (
-                Name,
-                Constant,
-                Attribute,
-                Subscript,
-                Call,
-                Compare,
-                Await,
-                UnaryOp,
-                Arg,
-                Starred,
-                Lambda,
-                And,
-                Or,
-                Not,
-                In,
-                NotIn,
-                Is,
-                IsNot,
-            ),
-        ):
-            # Handle remaining standard node types using existing logic
-            pass  # This part will be handled by the next section
+            text = self._expr_cache[id(expr)] = f"{value_str}[{slice_str}]"
+        return text
+
+    def _generate_compare(self, expr: BaseNode) -> str:
+        left_str = self._safe_generate_expr(expr.left)
+        parts = [left_str]
+        for op, comparator in zip(expr.ops, expr.comparators, strict=False):
+            op_str = self._generate_comparison_op(op)
+            comp_str = self._generate_expr(comparator)
+            parts.append(f"{op_str} {comp_str}")
+        return " ".join(parts)
 
+    def _generate_lambda(self, expr: BaseNode) -> str:
+        args_str = ""
+        if isinstance(expr.args, Arguments):
+            args_str = self._generate_arguments(expr.args)
+        body_str = self._safe_generate_expr(expr.body)
+        return f"lambda {args_str}: {body_str}"
+
+    def _generate_await(self, expr: BaseNode) -> str:
+        value_str = self._safe_generate_expr(expr.value)
+        return f"await {value_str}"
+
+    def _generate_unary_op(self, expr: BaseNode) -> str:
+        op_str = self._generate_comparison_op(expr.op)
+        operand_str = self._safe_generate_expr(expr.operand)
+        return f"{op_str} {operand_str}"
+
+    def _generate_bool_keyword(self, expr: BaseNode) -> str:
+        return type(expr).OP_STR
+
+    def _generate_arg(self, expr: BaseNode) -> str:
+        result = expr.arg
+        if expr.annotation:
+            annotation_str = self._safe_generate_expr(expr.annotation)
+            result += f": {annotation_str}"
+        return result
+
+    def _generate_type_param(self, expr: BaseNode) -> str:
+        if expr.bound:
+            bound_str = self._safe_generate_expr(expr.bound)
+            return f"{expr.name}: {bound_str}"
+        return str(expr.name)
+
+    def _generate_starred(self, expr: BaseNode) -> str:
+        value_str = self._safe_generate_expr(expr.value)
+        return f"*{value_str}"
+
+    def _generate_list_comp(self, expr: BaseNode) -> str:
+        elt_str = self._safe_generate_expr(expr.elt)
+        gens_str = " ".join([self._generate_comprehension(c) for c in expr.generators])
+        return f"[{elt_str} {gens_str}]"
+
+    def _generate_set_comp(self, expr: BaseNode) -> str:
+        elt_str = self._safe_generate_expr(expr.elt)
+        gens_str = " ".join([self._generate_comprehension(c) for c in expr.generators])
+        return f"{{{elt_str} {gens_str}}}"
+
+    def _generate_dict_comp(self, expr: BaseNode) -> str:
+        key_str = self._safe_generate_expr(expr.key)
+        value_str = self._safe_generate_expr(expr.value)
+        gens_str = " ".join([self._generate_comprehension(c) for c in expr.generators])
+        return f"{{{key_str}: {value_str} {gens_str}}}"
+
+    def _generate_generator_exp(self, expr: BaseNode) -> str:
+        elt_str = self._safe_generate_expr(expr.elt)
+        gens_str = " ".join([self._generate_comprehension(c) for c in expr.generators])
+        return f"({elt_str} {gens_str})"
+
+    def _generate_other_expr(self, expr: Any) -> str:
+        """Generate expression string for a type with no registered renderer"""
         return str(expr)
 
     def _generate_comprehension(self, comp: Comprehension) -> str:
@@ -622,6 +779,9 @@ class CodeGenerator:
         iter_str = self._safe_generate_expr(comp.iter)
 
         prefix = "async for" if comp.is_async else "for"
+        if not comp.ifs:
+            return f"{prefix} {target_str} in {iter_str}"
+
         parts = [f"{prefix} {target_str} in {iter_str}"]
 
         for if_clause in comp.ifs:
@@ -631,18 +791,16 @@ class CodeGenerator:
         return " ".join(parts)
 
     def _generate_comparison_op(self, op: BaseNode) -> str:
-        """Generate comparison operator string"""
-        from pycraft.nodes import In, Is, IsNot, Name, NotIn
-
-        if isinstance(op, In):
-            return "in"
-        elif isinstance(op, NotIn):
-            return "not in"
-        elif isinstance(op, Is):
-            return "is"
-        elif isinstance(op, IsNot):
-            return "is not"
-        elif isinstance(op, Name):
+        """Generate operator string"""
+        # Operator nodes carry their source text as a class attribute
+        op_str = getattr(type(op), "OP_STR", None)
+        if op_str is not None:
+            return op_str
+
+        if isinstance(op, OpKind):
+            return op.op_str
+
+        if isinstance(op, Name):
             # Handle Name nodes used as operators (e.g., Name(id=">"))
             return op.id
 
@@ -651,30 +809,22 @@ class CodeGenerator:
 
     def _generate_arguments(self, args: Arguments) -> str:
         """Generate function arguments string"""
-        from pycraft.nodes import Arguments
-
         if not isinstance(args, Arguments):
             return ""
 
-        parts = []
-
         # Regular args
-        for arg in args.args:
-            parts.append(self._generate_expr(arg))
+        parts = [self._generate_expr(arg) for arg in args.args]
 
         # Keyword-only args
         if args.kwonlyargs:
             if not parts:  # No regular args, add *
                 parts.append("*")
-            for arg in args.kwonlyargs:
-                parts.append(self._generate_expr(arg))
+            parts += [self._generate_expr(arg) for arg in args.kwonlyargs]
 
         return ", ".join(parts)
 
     def _safe_generate_with_item(self, item: BaseNode) -> str:
         """Generate with item string, handling BaseNode."""
-        from pycraft.nodes import WithItem
-
         if isinstance(item, WithItem):
             return self._generate_with_item(item)
         return str(item)
@@ -687,3 +837,73 @@ class CodeGenerator:
             vars_str = self._generate_expr(item.optional_vars)
             return f"{context_str} as {vars_str}"
         return context_str
+
+    # Constant renderers keyed by the exact type of the value
+    _CONST_FMT: ClassVar[dict[type, Callable[[Any, str | None], str]]] = {
+        str: _render_str_constant,
+        bool: lambda value, kind: "True" if value else "False",
+        type(None): lambda value, kind: "None",
+        int: lambda value, kind: str(value),
+        float: lambda value, kind: str(value),
+    }
+
+    # Emitters for statement nodes and renderers for expression nodes, keyed
+    # by node type; subclasses of a known node type are resolved through the
+    # MRO and cached on first use.
+    _DISPATCH: ClassVar[dict[type, Callable[..., None]]] = {
+        Import: _emit_import,
+        ImportFrom: _emit_import_from,
+        ImportGroup: _emit_import_group,
+        ClassDef: _emit_class_def,
+        FunctionDef: _emit_function_def,
+        AsyncFunctionDef: _emit_async_function_def,
+        If: _emit_if,
+        Elif: _emit_elif,
+        Else: _emit_else,
+        For: _emit_for,
+        AsyncFor: _emit_async_for,
+        While: _emit_while,
+        With: _emit_with,
+        Try: _emit_try,
+        ExceptHandler: _emit_except_handler,
+        Match: _emit_match,
+        MatchCase: _emit_match_case,
+        Expr: _emit_expr,
+        Assign: _emit_assign,
+        AugAssign: _emit_aug_assign,
+        AnnAssign: _emit_ann_assign,
+        Return: _emit_return,
+        Yield: _emit_yield,
+        Await: _emit_await,
+        Delete: _emit_delete,
+        Global: _emit_name_decl,
+        Nonlocal: _emit_name_decl,
+        Assert: _emit_assert,
+        Raise: _emit_raise,
+        Pass: _emit_pass,
+        Break: _emit_break,
+        Continue: _emit_continue,
+        Comment: _emit_comment,
+    }
+    _EXPR_DISPATCH: ClassVar[dict[type, Callable[..., str]]] = {
+        Name: _generate_name,
+        Constant: _generate_constant,
+        Alias: _generate_alias,
+        Call: _generate_call,
+        Attribute: _generate_attribute,
+        Subscript: _generate_subscript,
+        Compare: _generate_compare,
+        Lambda: _generate_lambda,
+        Await: _generate_await,
+        UnaryOp: _generate_unary_op,
+        And: _generate_bool_keyword,
+        Or: _generate_bool_keyword,
+        Not: _generate_bool_keyword,
+        Arg: _generate_arg,
+        TypeParam: _generate_type_param,
+        Starred: _generate_starred,
+        ListComp: _generate_list_comp,
+        SetComp: _generate_set_comp,
+        DictComp: _generate_dict_comp,
+        GeneratorExp: _generate_generator_exp,
+    }
@@ -65,6 +65,7 @@ from .operators import (
     Not,
     NotEq,
     NotIn,
+    OpKind,
     Or,
     Pow,
     RShift,
@@ -194,6 +195,7 @@ __all__ = [
     "UAdd",
     "USub",
     "Invert",
+    "OpKind",
     # Module
     "Module",
 ]
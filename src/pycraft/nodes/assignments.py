@@ -6,12 +6,12 @@ This module contains nodes for various assignment types:
 - AnnAssign: annotated assignment (x: int = value)
 """
 
-from dataclasses import dataclass, field
+from pycraft.core.base import BaseNode, field, node
 
-from pycraft.core.base import BaseNode
+from .operators import OpKind
 
 
-@dataclass
+@node
 class Assign[T: BaseNode](BaseNode):
     """Represents an assignment statement.
 
@@ -33,7 +33,7 @@ class Assign[T: BaseNode](BaseNode):
     comment: str | None = None
 
 
-@dataclass
+@node
 class AugAssign[T: BaseNode](BaseNode):
     """Represents an augmented assignment statement.
 
@@ -47,18 +47,18 @@ class AugAssign[T: BaseNode](BaseNode):
 
     Attributes:
         target: The target node being modified
-        op: The operation node (Add, Sub, Mult, etc.)
+        op: The operation node (Add, Sub, Mult, etc., or an OpKind)
         value: The value to apply the operation with
         comment: Optional inline comment
     """
 
     target: T | None = None
-    op: T | None = None
+    op: T | OpKind | None = None
     value: T | None = None
     comment: str | None = None
 
 
-@dataclass
+@node
 class AnnAssign[T: BaseNode](BaseNode):
     """Represents an annotated assignment statement.
 
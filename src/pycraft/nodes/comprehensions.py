@@ -8,12 +8,10 @@ This module contains nodes for comprehensions and generator expressions:
 - Comprehension: comprehension clause (for/if)
 """
 
-from dataclasses import dataclass, field
+from pycraft.core.base import BaseNode, field, node
 
-from pycraft.core.base import BaseNode
 
-
-@dataclass
+@node
 class Comprehension[T: BaseNode](BaseNode):
     """Represents a comprehension clause (for/if).
 
@@ -35,7 +33,7 @@ class Comprehension[T: BaseNode](BaseNode):
     is_async: int = 0
 
 
-@dataclass
+@node
 class ListComp[T: BaseNode, C: Comprehension](BaseNode):
     """Represents a list comprehension.
 
@@ -52,7 +50,7 @@ class ListComp[T: BaseNode, C: Comprehension](BaseNode):
     generators: list[C] = field(default_factory=list)
 
 
-@dataclass
+@node
 class SetComp[T: BaseNode, C: Comprehension](BaseNode):
     """Represents a set comprehension.
 
@@ -69,7 +67,7 @@ class SetComp[T: BaseNode, C: Comprehension](BaseNode):
     generators: list[C] = field(default_factory=list)
 
 
-@dataclass
+@node
 class DictComp[T: BaseNode, C: Comprehension](BaseNode):
     """Represents a dictionary comprehension.
 
@@ -88,7 +86,7 @@ class DictComp[T: BaseNode, C: Comprehension](BaseNode):
     generators: list[C] = field(default_factory=list)
 
 
-@dataclass
+@node
 class GeneratorExp[T: BaseNode, C: Comprehension](BaseNode):
     """Represents a generator expression.
 
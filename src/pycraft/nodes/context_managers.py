@@ -5,13 +5,11 @@ This module contains nodes for context managers:
 - WithItem: individual item in with statement
 """
 
-from dataclasses import dataclass, field
+from pycraft.core.base import BaseNode, BodyNode, field, node
 
-from pycraft.core.base import BaseNode
 
-
-@dataclass
-class With[T: BaseNode](BaseNode):
+@node
+class With[T: BaseNode](BaseNode, BodyNode):
     """Represents a with statement.
 
     Example:
@@ -31,7 +29,7 @@ class With[T: BaseNode](BaseNode):
     body: list[T] = field(default_factory=list)
 
 
-@dataclass
+@node
 class WithItem[T: BaseNode](BaseNode):
     """Represents a single item in a with statement.
 
@@ -8,13 +8,11 @@ This module contains nodes for control flow statements:
 - MatchCase: case clause in match
 """
 
-from dataclasses import dataclass, field
+from pycraft.core.base import BaseNode, BodyNode, field, node
 
-from pycraft.core.base import BaseNode
 
-
-@dataclass
-class If[T: BaseNode](BaseNode):
+@node
+class If[T: BaseNode](BaseNode, BodyNode):
     """Represents an if statement.
 
     Example:
@@ -40,8 +38,8 @@ class If[T: BaseNode](BaseNode):
     or_else: list[T] = field(default_factory=list)
 
 
-@dataclass
-class Elif[T: BaseNode](BaseNode):
+@node
+class Elif[T: BaseNode](BaseNode, BodyNode):
     """Represents an elif clause.
 
     This is used within an if statement's or_else.
@@ -60,8 +58,8 @@ class Elif[T: BaseNode](BaseNode):
     body: list[T] = field(default_factory=list)
 
 
-@dataclass
-class Else[T: BaseNode](BaseNode):
+@node
+class Else[T: BaseNode](BaseNode, BodyNode):
     """Represents an else clause.
 
     This is used within an if statement's or_else.
@@ -78,7 +76,7 @@ class Else[T: BaseNode](BaseNode):
     body: list[T] = field(default_factory=list)
 
 
-@dataclass
+@node
 class Match[T: BaseNode](BaseNode):
     """Represents a match statement (Python 3.10+).
 
@@ -101,8 +99,8 @@ class Match[T: BaseNode](BaseNode):
     cases: list[T] = field(default_factory=list)
 
 
-@dataclass
-class MatchCase[T: BaseNode](BaseNode):
+@node
+class MatchCase[T: BaseNode](BaseNode, BodyNode):
     """Represents a case clause in a match statement.
 
     Example:
@@ -8,13 +8,13 @@ This module contains nodes for exception handling:
 - Finally: finally clause (embedded in Try node)
 """
 
-from dataclasses import dataclass, field
+import sys
 
-from pycraft.core.base import BaseNode
+from pycraft.core.base import BaseNode, BodyNode, field, node
 
 
-@dataclass
-class Try[T: BaseNode](BaseNode):
+@node
+class Try[T: BaseNode](BaseNode, BodyNode):
     """Represents a try statement.
 
     Example:
@@ -39,8 +39,8 @@ class Try[T: BaseNode](BaseNode):
     finalbody: list[T] = field(default_factory=list)
 
 
-@dataclass
-class ExceptHandler[T: BaseNode](BaseNode):
+@node
+class ExceptHandler[T: BaseNode](BaseNode, BodyNode):
     """Represents an except clause in a try statement.
 
     Example:
@@ -61,9 +61,13 @@ class ExceptHandler[T: BaseNode](BaseNode):
     name: str | None = None
     body: list[T] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
 
-@dataclass
-class Finally[T: BaseNode](BaseNode):
+
+@node
+class Finally[T: BaseNode](BaseNode, BodyNode):
     """Represents a finally clause.
 
     This is typically embedded in a Try node's finalbody.
@@ -80,7 +84,7 @@ class Finally[T: BaseNode](BaseNode):
     body: list[T] = field(default_factory=list)
 
 
-@dataclass
+@node
 class Raise[T: BaseNode](BaseNode):
     """Represents a raise statement.
 
@@ -99,7 +103,7 @@ class Raise[T: BaseNode](BaseNode):
     cause: T | None = None
 
 
-@dataclass
+@node
 class Assert[T: BaseNode](BaseNode):
     """Represents an assert statement.
 
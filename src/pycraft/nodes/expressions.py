@@ -12,12 +12,14 @@ This module contains nodes for various expressions:
 - Keyword: keyword argument
 """
 
-from dataclasses import dataclass, field
+import sys
 
-from pycraft.core.base import BaseNode
+from pycraft.core.base import BaseNode, field, node
 
+from .operators import OpKind
 
-@dataclass
+
+@node
 class Call[T: BaseNode](BaseNode):
     """Represents a function or method call.
 
@@ -40,7 +42,7 @@ class Call[T: BaseNode](BaseNode):
     keywords: list[T] = field(default_factory=list)
 
 
-@dataclass
+@node
 class Keyword[T: BaseNode](BaseNode):
     """Represents a keyword argument in a function call.
 
@@ -56,8 +58,12 @@ class Keyword[T: BaseNode](BaseNode):
     arg: str | None = None
     value: T | None = None
 
+    def __post_init__(self) -> None:
+        if type(self.arg) is str:
+            self.arg = sys.intern(self.arg)
+
 
-@dataclass
+@node
 class BoolOp[T: BaseNode](BaseNode):
     """Represents a boolean operation.
 
@@ -66,15 +72,15 @@ class BoolOp[T: BaseNode](BaseNode):
         a or b or c
 
     Attributes:
-        op: The boolean operator (And, Or)
+        op: The boolean operator (And, Or, or an OpKind)
         values: List of operands
     """
 
-    op: T | None = None
+    op: T | OpKind | None = None
     values: list[T] = field(default_factory=list)
 
 
-@dataclass
+@node
 class UnaryOp[T: BaseNode](BaseNode):
     """Represents a unary operation.
 
@@ -84,15 +90,15 @@ class UnaryOp[T: BaseNode](BaseNode):
         +value
 
     Attributes:
-        op: The unary operator (Not, USub, UAdd)
+        op: The unary operator (Not, USub, UAdd, or an OpKind)
         operand: The operand
     """
 
-    op: T | None = None
+    op: T | OpKind | None = None
     operand: T | None = None
 
 
-@dataclass
+@node
 class BinOp[T: BaseNode](BaseNode):
     """Represents a binary operation.
 
@@ -103,16 +109,16 @@ class BinOp[T: BaseNode](BaseNode):
 
     Attributes:
         left: Left operand
-        op: The operator (Add, Sub, Mult, Div, etc.)
+        op: The operator (Add, Sub, Mult, Div, etc., or an OpKind)
         right: Right operand
     """
 
     left: T | None = None
-    op: T | None = None
+    op: T | OpKind | None = None
     right: T | None = None
 
 
-@dataclass
+@node
 class Compare[T: BaseNode](BaseNode):
     """Represents a comparison operation.
 
@@ -123,16 +129,16 @@ class Compare[T: BaseNode](BaseNode):
 
     Attributes:
         left: Left operand
-        ops: List of comparison operators
+        ops: List of comparison operators (nodes or OpKind values)
         comparators: List of comparison targets
     """
 
     left: T | None = None
-    ops: list[T] = field(default_factory=list)
+    ops: list[T | OpKind] = field(default_factory=list)
     comparators: list[T] = field(default_factory=list)
 
 
-@dataclass
+@node
 class Lambda[T: BaseNode](BaseNode):
     """Represents a lambda expression.
 
@@ -150,7 +156,7 @@ class Lambda[T: BaseNode](BaseNode):
     body: T | None = None
 
 
-@dataclass
+@node
 class IfExp[T: BaseNode](BaseNode):
     """Represents a conditional expression (ternary operator).
 
@@ -168,7 +174,7 @@ class IfExp[T: BaseNode](BaseNode):
     orelse: T | None = None
 
 
-@dataclass
+@node
 class Starred[T: BaseNode](BaseNode):
     """Represents a starred expression.
 
@@ -9,12 +9,12 @@ This module contains nodes for defining functions and classes:
 - TypeParam: type parameter (for generics)
 """
 
-from dataclasses import dataclass, field
+import sys
 
-from pycraft.core.base import BaseNode
+from pycraft.core.base import BaseNode, BodyNode, field, node
 
 
-@dataclass
+@node
 class Arg[T: BaseNode](BaseNode):
     """Represents a single function argument.
 
@@ -32,8 +32,12 @@ class Arg[T: BaseNode](BaseNode):
     annotation: T | None = None
     default: T | None = None
 
+    def __post_init__(self) -> None:
+        if type(self.arg) is str:
+            self.arg = sys.intern(self.arg)
 
-@dataclass
+
+@node
 class Arguments[T: BaseNode, A: Arg](BaseNode):
     """Represents function arguments specification.
 
@@ -62,8 +66,8 @@ class Arguments[T: BaseNode, A: Arg](BaseNode):
     posonlyargs: list[A] = field(default_factory=list)
 
 
-@dataclass
-class FunctionDef[T: BaseNode, A: Arguments](BaseNode):
+@node
+class FunctionDef[T: BaseNode, A: Arguments](BaseNode, BodyNode):
     """Represents a function definition.
 
     Example:
@@ -91,9 +95,13 @@ class FunctionDef[T: BaseNode, A: Arguments](BaseNode):
     decorator_list: list[T] = field(default_factory=list)
     type_params: list[T] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
+
 
-@dataclass
-class AsyncFunctionDef[T: BaseNode, A: Arguments](BaseNode):
+@node
+class AsyncFunctionDef[T: BaseNode, A: Arguments](BaseNode, BodyNode):
     """Represents an async function definition.
 
     Example:
@@ -117,9 +125,13 @@ class AsyncFunctionDef[T: BaseNode, A: Arguments](BaseNode):
     decorator_list: list[T] = field(default_factory=list)
     type_params: list[T] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
+
 
-@dataclass
-class ClassDef[T: BaseNode](BaseNode):
+@node
+class ClassDef[T: BaseNode](BaseNode, BodyNode):
     """Represents a Python class definition.
 
     This corresponds to the 'class' keyword in Python, used to define a new class
@@ -149,8 +161,12 @@ class ClassDef[T: BaseNode](BaseNode):
     body: list[T] = field(default_factory=list)
     decorators: list[T] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
 
-@dataclass
+
+@node
 class TypeParam[T: BaseNode](BaseNode):
     """Represents a type parameter for generic classes/functions.
 
@@ -169,6 +185,10 @@ class TypeParam[T: BaseNode](BaseNode):
     name: str = ""
     bound: T | None = None
 
+    def __post_init__(self) -> None:
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
+
 
 __all__ = [
     "Arg",
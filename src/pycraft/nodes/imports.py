@@ -6,12 +6,12 @@ This module contains nodes for Python import statements:
 - Alias: module as alias
 """
 
-from dataclasses import dataclass, field
+import sys
 
-from pycraft.core.base import BaseNode
+from pycraft.core.base import BaseNode, field, node
 
 
-@dataclass
+@node
 class Import[T: BaseNode](BaseNode):
     """Represents a Python import statement.
 
@@ -30,7 +30,7 @@ class Import[T: BaseNode](BaseNode):
     names: list[T] = field(default_factory=list)
 
 
-@dataclass
+@node
 class ImportFrom[T: BaseNode](BaseNode):
     """Represents a Python 'from ... import ...' statement.
 
@@ -53,8 +53,12 @@ class ImportFrom[T: BaseNode](BaseNode):
     names: list[T] = field(default_factory=list)
     level: int | None = None
 
+    def __post_init__(self) -> None:
+        if type(self.module) is str:
+            self.module = sys.intern(self.module)
 
-@dataclass
+
+@node
 class Alias(BaseNode):
     """Represents an alias in import statements (using 'as' keyword).
 
@@ -73,8 +77,14 @@ class Alias(BaseNode):
     name: str = ""
     asname: str | None = None
 
+    def __post_init__(self) -> None:
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
+        if type(self.asname) is str:
+            self.asname = sys.intern(self.asname)
+
 
-@dataclass
+@node
 class ImportGroup[T: BaseNode](BaseNode):
     """Represents a group of import statements.
 
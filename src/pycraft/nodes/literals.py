@@ -11,12 +11,13 @@ This module contains nodes representing literals and identifiers:
 - Tuple: Tuple literals
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass
 
-from pycraft.core.base import BaseNode
+from pycraft.core.base import BaseNode, field, node
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class Constant(BaseNode):
     """Represents a constant value (string, number, boolean, etc.).
 
@@ -38,7 +39,7 @@ class Constant(BaseNode):
     kind: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class Name(BaseNode):
     """Represents a variable or attribute name.
 
@@ -56,8 +57,13 @@ class Name(BaseNode):
 
     id: str = ""
 
+    def __post_init__(self) -> None:
+        # Identifiers repeat across a tree, so share one string per name
+        if type(self.id) is str:
+            self.id = sys.intern(self.id)
 
-@dataclass
+
+@node
 class Attribute[T: BaseNode](BaseNode):
     """Represents an attribute access (using dot notation).
 
@@ -77,8 +83,12 @@ class Attribute[T: BaseNode](BaseNode):
     value: T | None = None
     attr: str = ""
 
+    def __post_init__(self) -> None:
+        if type(self.attr) is str:
+            self.attr = sys.intern(self.attr)
+
 
-@dataclass
+@node
 class Subscript[T: BaseNode](BaseNode):
     """Represents a subscript expression (indexing or slicing).
 
@@ -99,7 +109,7 @@ class Subscript[T: BaseNode](BaseNode):
     slice: T | None = None
 
 
-@dataclass
+@node
 class Dict[T: BaseNode](BaseNode):
     """Represents a dictionary literal.
 
@@ -116,7 +126,7 @@ class Dict[T: BaseNode](BaseNode):
     values: list[T] = field(default_factory=list)
 
 
-@dataclass
+@node
 class List[T: BaseNode](BaseNode):
     """Represents a list literal.
 
@@ -131,7 +141,7 @@ class List[T: BaseNode](BaseNode):
     elts: list[T] = field(default_factory=list)
 
 
-@dataclass
+@node
 class Set[T: BaseNode](BaseNode):
     """Represents a set literal.
 
@@ -146,7 +156,7 @@ class Set[T: BaseNode](BaseNode):
     elts: list[T] = field(default_factory=list)
 
 
-@dataclass
+@node
 class Tuple[T: BaseNode](BaseNode):
     """Represents a tuple literal.
 
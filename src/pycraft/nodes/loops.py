@@ -6,13 +6,11 @@ This module contains nodes for loop statements:
 - While: while loop
 """
 
-from dataclasses import dataclass, field
+from pycraft.core.base import BaseNode, BodyNode, field, node
 
-from pycraft.core.base import BaseNode
 
-
-@dataclass
-class For[T: BaseNode](BaseNode):
+@node
+class For[T: BaseNode](BaseNode, BodyNode):
     """Represents a for loop.
 
     Example:
@@ -36,8 +34,8 @@ class For[T: BaseNode](BaseNode):
     or_else: list[T] = field(default_factory=list)
 
 
-@dataclass
-class AsyncFor[T: BaseNode](BaseNode):
+@node
+class AsyncFor[T: BaseNode](BaseNode, BodyNode):
     """Represents an async for loop.
 
     Example:
@@ -58,8 +56,8 @@ class AsyncFor[T: BaseNode](BaseNode):
     or_else: list[T] = field(default_factory=list)
 
 
-@dataclass
-class While[T: BaseNode](BaseNode):
+@node
+class While[T: BaseNode](BaseNode, BodyNode):
     """Represents a while loop.
 
     Example:
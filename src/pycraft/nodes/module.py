@@ -3,13 +3,11 @@
 This module contains the Module node which represents a Python file/module.
 """
 
-from dataclasses import dataclass, field
+from pycraft.core.base import BaseNode, BodyNode, field, node
 
-from pycraft.core.base import BaseNode
 
-
-@dataclass
-class Module[T: BaseNode](BaseNode):
+@node
+class Module[T: BaseNode](BaseNode, BodyNode):
     """Represents a Python module (a file containing Python code).
 
     This serves as the top-level container for all code in a Python file,
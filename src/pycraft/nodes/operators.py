@@ -16,219 +16,341 @@ Unary operators:
 - UAdd, USub, Invert
 """
 
-from dataclasses import dataclass
-
-from pycraft.core.base import BaseNode
+from enum import IntEnum
+
+from pycraft.core.base import _SharedNode, node
+
+
+class OpKind(IntEnum):
+    """Integer code for each operator.
+
+    BoolOp, UnaryOp, BinOp and Compare accept an OpKind wherever they take an
+    operator node, and every operator class records its code as ``KIND``.
+    """
+
+    AND = 0
+    OR = 1
+    NOT = 2
+    EQ = 3
+    NOTEQ = 4
+    LT = 5
+    LTE = 6
+    GT = 7
+    GTE = 8
+    IS = 9
+    ISNOT = 10
+    IN = 11
+    NOTIN = 12
+    ADD = 13
+    SUB = 14
+    MULT = 15
+    DIV = 16
+    FLOORDIV = 17
+    MOD = 18
+    POW = 19
+    MATMULT = 20
+    LSHIFT = 21
+    RSHIFT = 22
+    BITOR = 23
+    BITXOR = 24
+    BITAND = 25
+    UADD = 26
+    USUB = 27
+    INVERT = 28
+
+    @property
+    def op_str(self) -> str:
+        """The operator's source text, the same as its class's OP_STR."""
+        return _OP_STRS[self]
+
+
+class _Operator(_SharedNode):
+    """Base class for operator nodes.
+
+    Operators carry no fields, so every ``Add()`` is the same object.
+    """
+
+    __slots__ = ()
 
 
 # Boolean operators
-@dataclass
-class And(BaseNode):
+@node
+class And(_Operator):
     """Represents boolean AND operator."""
 
-    pass
+    OP_STR = "and"
+    KIND = OpKind.AND
 
 
-@dataclass
-class Or(BaseNode):
+@node
+class Or(_Operator):
     """Represents boolean OR operator."""
 
-    pass
+    OP_STR = "or"
+    KIND = OpKind.OR
 
 
-@dataclass
-class Not(BaseNode):
+@node
+class Not(_Operator):
     """Represents boolean NOT operator."""
 
-    pass
+    OP_STR = "not"
+    KIND = OpKind.NOT
 
 
 # Comparison operators
-@dataclass
-class Eq(BaseNode):
+@node
+class Eq(_Operator):
     """Represents == operator."""
 
-    pass
+    OP_STR = "=="
+    KIND = OpKind.EQ
 
 
-@dataclass
-class NotEq(BaseNode):
+@node
+class NotEq(_Operator):
     """Represents != operator."""
 
-    pass
+    OP_STR = "!="
+    KIND = OpKind.NOTEQ
 
 
-@dataclass
-class Lt(BaseNode):
+@node
+class Lt(_Operator):
     """Represents < operator."""
 
-    pass
+    OP_STR = "<"
+    KIND = OpKind.LT
 
 
-@dataclass
-class LtE(BaseNode):
+@node
+class LtE(_Operator):
     """Represents <= operator."""
 
-    pass
+    OP_STR = "<="
+    KIND = OpKind.LTE
 
 
-@dataclass
-class Gt(BaseNode):
+@node
+class Gt(_Operator):
     """Represents > operator."""
 
-    pass
+    OP_STR = ">"
+    KIND = OpKind.GT
 
 
-@dataclass
-class GtE(BaseNode):
+@node
+class GtE(_Operator):
     """Represents >= operator."""
 
-    pass
+    OP_STR = ">="
+    KIND = OpKind.GTE
 
 
-@dataclass
-class Is(BaseNode):
+@node
+class Is(_Operator):
     """Represents 'is' operator."""
 
     __kw__ = "is"
+    OP_STR = "is"
+    KIND = OpKind.IS
 
 
-@dataclass
-class IsNot(BaseNode):
+@node
+class IsNot(_Operator):
     """Represents 'is not' operator."""
 
     __kw__ = "is not"
+    OP_STR = "is not"
+    KIND = OpKind.ISNOT
 
 
-@dataclass
-class In(BaseNode):
+@node
+class In(_Operator):
     """Represents 'in' operator."""
 
     __kw__ = "in"
+    OP_STR = "in"
+    KIND = OpKind.IN
 
 
-@dataclass
-class NotIn(BaseNode):
+@node
+class NotIn(_Operator):
     """Represents 'not in' operator."""
 
     __kw__ = "not in"
+    OP_STR = "not in"
+    KIND = OpKind.NOTIN
 
 
 # Binary operators
-@dataclass
-class Add(BaseNode):
+@node
+class Add(_Operator):
     """Represents + operator."""
 
-    pass
+    OP_STR = "+"
+    KIND = OpKind.ADD
 
 
-@dataclass
-class Sub(BaseNode):
+@node
+class Sub(_Operator):
     """Represents - operator."""
 
-    pass
+    OP_STR = "-"
+    KIND = OpKind.SUB
 
 
-@dataclass
-class Mult(BaseNode):
+@node
+class Mult(_Operator):
     """Represents * operator."""
 
-    pass
+    OP_STR = "*"
+    KIND = OpKind.MULT
 
 
-@dataclass
-class Div(BaseNode):
+@node
+class Div(_Operator):
     """Represents / operator."""
 
-    pass
+    OP_STR = "/"
+    KIND = OpKind.DIV
 
 
-@dataclass
-class FloorDiv(BaseNode):
+@node
+class FloorDiv(_Operator):
     """Represents // operator."""
 
-    pass
+    OP_STR = "//"
+    KIND = OpKind.FLOORDIV
 
 
-@dataclass
-class Mod(BaseNode):
+@node
+class Mod(_Operator):
     """Represents % operator."""
 
-    pass
+    OP_STR = "%"
+    KIND = OpKind.MOD
 
 
-@dataclass
-class Pow(BaseNode):
+@node
+class Pow(_Operator):
     """Represents ** operator."""
 
-    pass
+    OP_STR = "**"
+    KIND = OpKind.POW
 
 
-@dataclass
-class MatMult(BaseNode):
+@node
+class MatMult(_Operator):
     """Represents @ operator (matrix multiplication)."""
 
-    pass
+    OP_STR = "@"
+    KIND = OpKind.MATMULT
 
 
-@dataclass
-class LShift(BaseNode):
+@node
+class LShift(_Operator):
     """Represents << operator (left shift)."""
 
-    pass
+    OP_STR = "<<"
+    KIND = OpKind.LSHIFT
 
 
-@dataclass
-class RShift(BaseNode):
+@node
+class RShift(_Operator):
     """Represents >> operator (right shift)."""
 
-    pass
+    OP_STR = ">>"
+    KIND = OpKind.RSHIFT
 
 
-@dataclass
-class BitOr(BaseNode):
+@node
+class BitOr(_Operator):
     """Represents | operator (bitwise or)."""
 
-    pass
+    OP_STR = "|"
+    KIND = OpKind.BITOR
 
 
-@dataclass
-class BitXor(BaseNode):
+@node
+class BitXor(_Operator):
     """Represents ^ operator (bitwise xor)."""
 
-    pass
+    OP_STR = "^"
+    KIND = OpKind.BITXOR
 
 
-@dataclass
-class BitAnd(BaseNode):
+@node
+class BitAnd(_Operator):
     """Represents & operator (bitwise and)."""
 
-    pass
+    OP_STR = "&"
+    KIND = OpKind.BITAND
 
 
 # Unary operators
-@dataclass
-class UAdd(BaseNode):
+@node
+class UAdd(_Operator):
     """Represents unary + operator."""
 
-    pass
+    OP_STR = "+"
+    KIND = OpKind.UADD
 
 
-@dataclass
-class USub(BaseNode):
+@node
+class USub(_Operator):
     """Represents unary - operator."""
 
-    pass
+    OP_STR = "-"
+    KIND = OpKind.USUB
 
 
-@dataclass
-class Invert(BaseNode):
+@node
+class Invert(_Operator):
     """Represents ~ operator (bitwise not)."""
 
-    pass
-
+    OP_STR = "~"
+    KIND = OpKind.INVERT
+
+
+# Source text by OpKind, in code order
+_OP_STRS: tuple[str, ...] = tuple(
+    op.OP_STR
+    for op in (
+        And,
+        Or,
+        Not,
+        Eq,
+        NotEq,
+        Lt,
+        LtE,
+        Gt,
+        GtE,
+        Is,
+        IsNot,
+        In,
+        NotIn,
+        Add,
+        Sub,
+        Mult,
+        Div,
+        FloorDiv,
+        Mod,
+        Pow,
+        MatMult,
+        LShift,
+        RShift,
+        BitOr,
+        BitXor,
+        BitAnd,
+        UAdd,
+        USub,
+        Invert,
+    )
+)
 
 __all__ = [
+    "OpKind",
     # Boolean
     "And",
     "Or",
@@ -14,13 +14,25 @@ This module contains nodes for various Python statements:
 - Expr: expression statement
 """
 
-from dataclasses import dataclass, field
+import sys
 
-from pycraft.core.base import BaseNode
+from pycraft.core.base import BaseNode, _SharedNode, field, node
 
 
-@dataclass
-class Pass(BaseNode):
+@node
+class _ValueStatement(BaseNode):
+    """Base class for statements made of a keyword and one optional value.
+
+    Return, Yield, Await and Expr share this single field declaration and
+    differ only in their ``__kw__``.
+    """
+
+    __match_args__ = ("value",)
+    value: BaseNode | None = None
+
+
+@node
+class Pass(_SharedNode):
     """Represents a pass statement.
 
     This is a null operation - when it is executed, nothing happens.
@@ -33,8 +45,8 @@ class Pass(BaseNode):
     __kw__ = "pass"
 
 
-@dataclass
-class Return[T: BaseNode](BaseNode):
+@node
+class Return(_ValueStatement):
     """Represents a return statement.
 
     This exits a function and optionally returns a value.
@@ -49,11 +61,10 @@ class Return[T: BaseNode](BaseNode):
     """
 
     __kw__ = "return"
-    value: T | None = None
 
 
-@dataclass
-class Yield[T: BaseNode](BaseNode):
+@node
+class Yield(_ValueStatement):
     """Represents a yield expression.
 
     Used in generators to yield values.
@@ -67,11 +78,10 @@ class Yield[T: BaseNode](BaseNode):
     """
 
     __kw__ = "yield"
-    value: T | None = None
 
 
-@dataclass
-class Await[T: BaseNode](BaseNode):
+@node
+class Await(_ValueStatement):
     """Represents an await expression.
 
     Used in async functions to await coroutines.
@@ -85,11 +95,10 @@ class Await[T: BaseNode](BaseNode):
     """
 
     __kw__ = "await"
-    value: T | None = None
 
 
-@dataclass
-class Break(BaseNode):
+@node
+class Break(_SharedNode):
     """Represents a break statement.
 
     Exits the nearest enclosing loop.
@@ -101,8 +110,8 @@ class Break(BaseNode):
     __kw__ = "break"
 
 
-@dataclass
-class Continue(BaseNode):
+@node
+class Continue(_SharedNode):
     """Represents a continue statement.
 
     Continues to the next iteration of the nearest enclosing loop.
@@ -114,8 +123,8 @@ class Continue(BaseNode):
     __kw__ = "continue"
 
 
-@dataclass
-class Delete[T: BaseNode](BaseNode):
+@node
+class Delete(BaseNode):
     """Represents a del statement.
 
     Deletes a name, attribute, or subscript.
@@ -130,11 +139,44 @@ class Delete[T: BaseNode](BaseNode):
     """
 
     __kw__ = "del"
-    targets: list[T] = field(default_factory=list)
+    __match_args__ = ("targets",)
+    targets: list[BaseNode] = field(default_factory=list)
 
+    def add_target(self, target: BaseNode) -> None:
+        """Append a target, copying a tuple or other sequence to a list first.
+
+        Args:
+            target: The node to delete
+        """
+        if type(self.targets) is not list:
+            self.targets = list(self.targets)
+        self.targets.append(target)
+
+
+@node
+class _NameDecl(BaseNode):
+    """Base class for the global and nonlocal declarations.
+
+    Global and Nonlocal share this field declaration and ``add_name`` and
+    differ only in their ``__kw__``.
+    """
 
-@dataclass
-class Global(BaseNode):
+    __match_args__ = ("names",)
+    names: list[str] = field(default_factory=list)
+
+    def add_name(self, name: str) -> None:
+        """Append a name, copying a tuple or other sequence to a list first.
+
+        Args:
+            name: The variable name to declare
+        """
+        if type(self.names) is not list:
+            self.names = list(self.names)
+        self.names.append(name)
+
+
+@node
+class Global(_NameDecl):
     """Represents a global declaration.
 
     Declares that names are global variables.
@@ -147,11 +189,10 @@ class Global(BaseNode):
     """
 
     __kw__ = "global"
-    names: list[str] = field(default_factory=list)
 
 
-@dataclass
-class Nonlocal(BaseNode):
+@node
+class Nonlocal(_NameDecl):
     """Represents a nonlocal declaration.
 
     Declares that names are from an enclosing scope.
@@ -164,10 +205,9 @@ class Nonlocal(BaseNode):
     """
 
     __kw__ = "nonlocal"
-    names: list[str] = field(default_factory=list)
 
 
-@dataclass
+@node
 class Comment(BaseNode):
     """Represents a comment in the code.
 
@@ -181,11 +221,18 @@ class Comment(BaseNode):
         text: The comment text (without the # prefix)
     """
 
+    __match_args__ = ("text",)
     text: str = ""
 
+    def __post_init__(self) -> None:
+        # The same comments (noqa markers, TODOs, headers) recur, so share
+        # one string per text; the empty string is already shared
+        if type(self.text) is str and self.text:
+            self.text = sys.intern(self.text)
 
-@dataclass
-class Expr[T: BaseNode](BaseNode):
+
+@node
+class Expr(_ValueStatement):
     """Represents an expression statement.
 
     This corresponds to any expression that stands alone on a line,
@@ -200,8 +247,6 @@ class Expr[T: BaseNode](BaseNode):
         value: The expression node
     """
 
-    value: T | None = None
-
 
 __all__ = [
     "Pass",
@@ -0,0 +1,163 @@
+"""Tests for attaching elif/else/except/finally clauses in the block builders."""
+
+import io
+import textwrap
+
+from pycraft.builder import else_, elif_, except_, finally_, for_, if_, try_, while_
+from pycraft.core.builder import Builder
+from pycraft.generator.base import CodeGenerator
+from pycraft.nodes import Break, Call, Expr, Name, Pass
+
+
+def _render(builder: Builder) -> str:
+    out = io.StringIO()
+    CodeGenerator(indent_char="    ").write(builder, out)
+    return out.getvalue().strip()
+
+
+def _call(name: str) -> Expr:
+    return Expr(value=Call(func=Name(id=name)))
+
+
+def _expected(code: str) -> str:
+    return textwrap.dedent(code).strip()
+
+
+def test_nested_if_elif_else():
+    b = Builder()
+    with if_(b, Name(id="a")):
+        b.add_node(_call("f"))
+        with elif_(b, Name(id="c")):
+            b.add_node(_call("g"))
+        with else_(b):
+            b.add_node(_call("h"))
+
+    assert _render(b) == _expected(
+        """
+        if a:
+            f()
+        elif c:
+            g()
+        else:
+            h()
+        """
+    )
+
+
+def test_sequential_if_elif_else():
+    b = Builder()
+    with if_(b, Name(id="a")):
+        b.add_node(_call("f"))
+    with elif_(b, Name(id="c")):
+        b.add_node(_call("g"))
+    with else_(b):
+        b.add_node(_call("h"))
+
+    assert _render(b) == _expected(
+        """
+        if a:
+            f()
+        elif c:
+            g()
+        else:
+            h()
+        """
+    )
+
+
+def test_sequential_if_else_inside_loop_stays_with_if():
+    b = Builder()
+    with for_(b, Name(id="x"), Name(id="xs")):
+        with if_(b, Name(id="x")):
+            b.add_node(_call("f"))
+        with elif_(b, Name(id="c")):
+            b.add_node(_call("g"))
+        with else_(b):
+            b.add_node(_call("h"))
+
+    assert _render(b) == _expected(
+        """
+        for x in xs:
+            if x:
+                f()
+            elif c:
+                g()
+            else:
+                h()
+        """
+    )
+
+
+def test_nested_and_sequential_loop_else():
+    b = Builder()
+    with while_(b, Name(id="w")):
+        b.add_node(Break())
+        with else_(b):
+            b.add_node(_call("f"))
+    with for_(b, Name(id="x"), Name(id="xs")):
+        b.add_node(Break())
+    with else_(b):
+        b.add_node(_call("g"))
+
+    assert _render(b) == _expected(
+        """
+        while w:
+            break
+        else:
+            f()
+        for x in xs:
+            break
+        else:
+            g()
+        """
+    )
+
+
+def test_nested_try_except_else_finally():
+    b = Builder()
+    with try_(b):
+        b.add_node(_call("f"))
+        with except_(b, Name(id="ValueError"), "e"):
+            b.add_node(Pass())
+        with else_(b):
+            b.add_node(_call("g"))
+        with finally_(b):
+            b.add_node(_call("h"))
+
+    assert _render(b) == _expected(
+        """
+        try:
+            f()
+        except ValueError as e:
+            pass
+        else:
+            g()
+        finally:
+            h()
+        """
+    )
+
+
+def test_sequential_try_except_else_finally():
+    b = Builder()
+    with try_(b):
+        b.add_node(_call("f"))
+    with except_(b, Name(id="ValueError"), "e"):
+        b.add_node(Pass())
+    with else_(b):
+        b.add_node(_call("g"))
+    with finally_(b):
+        b.add_node(_call("h"))
+
+    assert _render(b) == _expected(
+        """
+        try:
+            f()
+        except ValueError as e:
+            pass
+        else:
+            g()
+        finally:
+            h()
+        """
+    )